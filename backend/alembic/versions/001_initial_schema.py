@@ -3,6 +3,7 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 import uuid
+from app.db.migration_utils import check_enum_exists
 
 # revision identifiers, used by Alembic.
 revision = '001_initial_schema'
@@ -13,13 +14,8 @@ depends_on = None
 
 def upgrade() -> None:
     # Create user role enum (check if exists first)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE userrole AS ENUM ('psychologist', 'admin');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
+    if not check_enum_exists(op, 'userrole'):
+        op.execute("CREATE TYPE userrole AS ENUM ('psychologist', 'admin')")
     
     # Create clinics table first (no foreign keys yet)
     op.create_table(
@@ -31,17 +27,16 @@ def upgrade() -> None:
         sa.Column('contact_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.UniqueConstraint('email', name='uq_clinics_email')
     )
-    op.create_index('ix_clinics_id', 'clinics', ['id'])
     
     # Create users table
-    # Note: We create the enum separately above, so we use sa.String here and cast in SQL
+    # Note: The enum is created above, so the column uses it directly (create_type=False)
     op.create_table(
         'users',
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
         sa.Column('email', sa.String(), nullable=False),
         sa.Column('full_name', sa.String(), nullable=False),
         sa.Column('password_hash', sa.String(), nullable=False),
-        sa.Column('role', sa.String(), nullable=False),  # Will be constrained by enum
+        sa.Column('role', postgresql.ENUM('psychologist', 'admin', name='userrole', create_type=False), nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('clinic_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
@@ -49,11 +44,7 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['clinic_id'], ['clinics.id'], name='fk_users_clinic_id'),
         sa.UniqueConstraint('email', name='uq_users_email')
     )
-    
-    # Add type constraint for role column
-    op.execute("ALTER TABLE users ALTER COLUMN role TYPE userrole USING role::userrole")
-    op.create_index('ix_users_id', 'users', ['id'])
-    op.create_index('ix_users_email', 'users', ['email'])
+    op.execute("CREATE INDEX ix_users_email ON users (email)")
     
     # Add foreign key from clinics to users for contact_id
     op.create_foreign_key('fk_clinics_contact_id', 'clinics', 'users', ['contact_id'], ['id'])
@@ -70,22 +61,18 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='fk_refresh_tokens_user_id'),
         sa.UniqueConstraint('token_hash', name='uq_refresh_tokens_token_hash')
     )
-    op.create_index('ix_refresh_tokens_id', 'refresh_tokens', ['id'])
-    op.create_index('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'])
+    op.execute("CREATE INDEX ix_refresh_tokens_token_hash ON refresh_tokens (token_hash)")
 
 
 def downgrade() -> None:
     op.drop_index('ix_refresh_tokens_token_hash', 'refresh_tokens')
-    op.drop_index('ix_refresh_tokens_id', 'refresh_tokens')
     op.drop_table('refresh_tokens')
     
     op.drop_constraint('fk_clinics_contact_id', 'clinics', type_='foreignkey')
     
     op.drop_index('ix_users_email', 'users')
-    op.drop_index('ix_users_id', 'users')
     op.drop_table('users')
     
-    op.drop_index('ix_clinics_id', 'clinics')
     op.drop_table('clinics')
     
     op.execute('DROP TYPE userrole')
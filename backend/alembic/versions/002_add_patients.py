@@ -9,6 +9,7 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 import uuid
+from app.db.migration_utils import check_enum_exists
 
 # revision identifiers, used by Alembic.
 revision = '002_add_patients'
@@ -19,13 +20,8 @@ depends_on = None
 
 def upgrade() -> None:
     # Create entity_type enum (check if exists first)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE entity_type AS ENUM ('symptom', 'medication', 'feeling');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
+    if not check_enum_exists(op, 'entity_type'):
+        op.execute("CREATE TYPE entity_type AS ENUM ('symptom', 'medication', 'feeling')")
     
     # Create patients table
     op.create_table(
@@ -47,18 +43,17 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
         sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='fk_patients_created_by'),
     )
-    op.create_index('ix_patients_id', 'patients', ['id'])
     op.create_index('ix_patients_email', 'patients', ['email'])
     op.create_index('ix_patients_is_active', 'patients', ['is_active'])
     op.create_index('ix_patients_created_by', 'patients', ['created_by'])
     
     # Create patient_entities table
-    # Note: We create the enum separately above, so we use sa.String here and cast in SQL
+    # Note: The enum is created above, so the column uses it directly (create_type=False)
     op.create_table(
         'patient_entities',
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
         sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('type', sa.String(), nullable=False),  # Will be constrained by enum
+        sa.Column('type', postgresql.ENUM('symptom', 'medication', 'feeling', name='entity_type', create_type=False), nullable=False),
         sa.Column('value', sa.Text(), nullable=False),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
@@ -66,10 +61,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='fk_patient_entities_created_by'),
     )
     
-    # Add type constraint for type column
-    op.execute("ALTER TABLE patient_entities ALTER COLUMN type TYPE entity_type USING type::entity_type")
-    
-    op.create_index('ix_patient_entities_id', 'patient_entities', ['id'])
     op.create_index('ix_patient_entities_patient_id', 'patient_entities', ['patient_id'])
     op.create_index('ix_patient_entities_type', 'patient_entities', ['type'])
 
@@ -77,13 +68,11 @@ def upgrade() -> None:
 def downgrade() -> None:
     op.drop_index('ix_patient_entities_type', 'patient_entities')
     op.drop_index('ix_patient_entities_patient_id', 'patient_entities')
-    op.drop_index('ix_patient_entities_id', 'patient_entities')
     op.drop_table('patient_entities')
     
     op.drop_index('ix_patients_created_by', 'patients')
     op.drop_index('ix_patients_is_active', 'patients')
     op.drop_index('ix_patients_email', 'patients')
-    op.drop_index('ix_patients_id', 'patients')
     op.drop_table('patients')
     
     op.execute('DROP TYPE entity_type')
@@ -9,6 +9,7 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 import uuid
+from app.db.migration_utils import check_enum_exists
 
 # revision identifiers, used by Alembic.
 revision = '003_add_notes'
@@ -19,13 +20,8 @@ depends_on = None
 
 def upgrade() -> None:
     # Create note_kind enum (check if exists first)
-    op.execute("""
-        DO $$ BEGIN
-            CREATE TYPE note_kind AS ENUM ('conceptualization', 'followup', 'split');
-        EXCEPTION
-            WHEN duplicate_object THEN null;
-        END $$;
-    """)
+    if not check_enum_exists(op, 'note_kind'):
+        op.execute("CREATE TYPE note_kind AS ENUM ('conceptualization', 'followup', 'split')")
     
     # Create notes table
     op.create_table(
@@ -34,7 +30,7 @@ def upgrade() -> None:
         sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('author_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('parent_note_id', postgresql.UUID(as_uuid=True), nullable=True),  # For split notes
-        sa.Column('kind', sa.String(), nullable=False),  # Will be constrained by enum
+        sa.Column('kind', postgresql.ENUM('conceptualization', 'followup', 'split', name='note_kind', create_type=False), nullable=False),
         sa.Column('title', sa.String(), nullable=False),
         sa.Column('content_markdown', sa.Text(), nullable=False),
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
@@ -44,10 +40,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['parent_note_id'], ['notes.id'], name='fk_notes_parent_note_id'),
     )
     
-    # Add type constraint for kind column
-    op.execute("ALTER TABLE notes ALTER COLUMN kind TYPE note_kind USING kind::note_kind")
-    
-    op.create_index('ix_notes_id', 'notes', ['id'])
     op.create_index('ix_notes_patient_id', 'notes', ['patient_id'])
     op.create_index('ix_notes_author_id', 'notes', ['author_id'])
     op.create_index('ix_notes_parent_note_id', 'notes', ['parent_note_id'])
@@ -66,7 +58,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['editor_id'], ['users.id'], name='fk_note_versions_editor_id'),
     )
     
-    op.create_index('ix_note_versions_id', 'note_versions', ['id'])
     op.create_index('ix_note_versions_note_id', 'note_versions', ['note_id'])
     op.create_index('ix_note_versions_note_id_version', 'note_versions', ['note_id', 'version_number'], unique=True)
 
@@ -74,14 +65,12 @@ def upgrade() -> None:
 def downgrade() -> None:
     op.drop_index('ix_note_versions_note_id_version', 'note_versions')
     op.drop_index('ix_note_versions_note_id', 'note_versions')
-    op.drop_index('ix_note_versions_id', 'note_versions')
     op.drop_table('note_versions')
     
     op.drop_index('ix_notes_kind', 'notes')
     op.drop_index('ix_notes_parent_note_id', 'notes')
     op.drop_index('ix_notes_author_id', 'notes')
     op.drop_index('ix_notes_patient_id', 'notes')
-    op.drop_index('ix_notes_id', 'notes')
     op.drop_table('notes')
     
     op.execute('DROP TYPE note_kind')
@@ -0,0 +1,42 @@
+"""Add composite indexes for patient note listings.
+
+Revision ID: 004_note_composite_indexes
+Revises: 003_add_notes
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_note_composite_indexes'
+down_revision = '003_add_notes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # notes already holds data at this point, so build the indexes
+    # CONCURRENTLY (which cannot run inside a transaction) to avoid
+    # blocking writes during deploys
+    with op.get_context().autocommit_block():
+        # patient_id leads both indexes since every note listing filters on it;
+        # the second one also serves the newest-first ordering of list_notes
+        op.create_index(
+            'ix_notes_patient_kind', 'notes', ['patient_id', 'kind'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_notes_patient_created', 'notes', ['patient_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        
+        # Covered by the composite indexes above
+        op.drop_index('ix_notes_patient_id', 'notes', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_notes_patient_id', 'notes', ['patient_id'], postgresql_concurrently=True)
+        op.drop_index('ix_notes_patient_created', 'notes', postgresql_concurrently=True)
+        op.drop_index('ix_notes_patient_kind', 'notes', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Drop indexes duplicating primary key indexes.
+
+Revision ID: 005_drop_redundant_pk_indexes
+Revises: 004_note_composite_indexes
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005_drop_redundant_pk_indexes'
+down_revision = '004_note_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Postgres already backs every primary key with a unique btree, so these only
+# add write amplification. Databases created after 001-003 stopped emitting
+# them won't have them, hence IF EXISTS.
+TABLES = [
+    'clinics',
+    'users',
+    'refresh_tokens',
+    'patients',
+    'patient_entities',
+    'notes',
+    'note_versions',
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_id', table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'])
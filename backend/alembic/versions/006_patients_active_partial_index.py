@@ -0,0 +1,34 @@
+"""Add partial index for active patients per psychologist.
+
+Revision ID: 006_patients_active_partial_index
+Revises: 005_drop_redundant_pk_indexes
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_patients_active_partial_index'
+down_revision = '005_drop_redundant_pk_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Hot path of list_patients: one psychologist's active patients
+        op.create_index(
+            'ix_patients_created_by_active', 'patients', ['created_by'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True
+        )
+        
+        # is_active alone is too low-selectivity to be useful
+        op.drop_index('ix_patients_is_active', 'patients', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_patients_is_active', 'patients', ['is_active'], postgresql_concurrently=True)
+        op.drop_index('ix_patients_created_by_active', 'patients', postgresql_concurrently=True)
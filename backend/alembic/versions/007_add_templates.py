@@ -0,0 +1,42 @@
+"""Add templates table.
+
+The Template model had no migration; create it here with a unique
+(owner_id, name) constraint so seeders can upsert on it.
+
+Revision ID: 007_add_templates
+Revises: 006_patients_active_partial_index
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import uuid
+
+# revision identifiers, used by Alembic.
+revision = '007_add_templates'
+down_revision = '006_patients_active_partial_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'templates',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
+        sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=True),  # NULL for system defaults
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('content_markdown', sa.Text(), nullable=False),
+        sa.Column('is_default', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], name='fk_templates_owner_id'),
+        sa.UniqueConstraint('owner_id', 'name', name='uq_templates_owner_name'),
+    )
+    
+    op.create_index('ix_templates_owner_id', 'templates', ['owner_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_templates_owner_id', 'templates')
+    op.drop_table('templates')
@@ -0,0 +1,33 @@
+"""Store refresh token hashes as raw bytes.
+
+Revision ID: 008_refresh_token_hash_bytea
+Revises: 007_add_templates
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_refresh_token_hash_bytea'
+down_revision = '007_add_templates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_refresh_tokens_token_hash already indexes the column
+    op.drop_index('ix_refresh_tokens_token_hash', 'refresh_tokens')
+    
+    # 32-byte digest instead of 64-char hex; existing hashes convert in place
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "ALTER COLUMN token_hash TYPE bytea USING decode(token_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "ALTER COLUMN token_hash TYPE varchar USING encode(token_hash, 'hex')"
+    )
+    op.create_index('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'])
@@ -0,0 +1,52 @@
+"""Add composite indexes for patient and patient entity listings.
+
+Revision ID: 009_patient_listing_composite_indexes
+Revises: 008_refresh_token_hash_bytea
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_patient_listing_composite_indexes'
+down_revision = '008_refresh_token_hash_bytea'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # list_patients filters on created_by (and usually is_active) and
+        # orders by created_at DESC, so all three can come from one index
+        op.create_index(
+            'ix_patients_creator_active_created', 'patients',
+            ['created_by', 'is_active', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_patient_entities_patient_created', 'patient_entities',
+            ['patient_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        
+        # Covered by the composite indexes above
+        op.drop_index('ix_patients_created_by_active', 'patients', postgresql_concurrently=True)
+        op.drop_index('ix_patients_created_by', 'patients', postgresql_concurrently=True)
+        op.drop_index('ix_patient_entities_patient_id', 'patient_entities', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_patient_entities_patient_id', 'patient_entities', ['patient_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index('ix_patients_created_by', 'patients', ['created_by'], postgresql_concurrently=True)
+        op.create_index(
+            'ix_patients_created_by_active', 'patients', ['created_by'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_patient_entities_patient_created', 'patient_entities', postgresql_concurrently=True)
+        op.drop_index('ix_patients_creator_active_created', 'patients', postgresql_concurrently=True)
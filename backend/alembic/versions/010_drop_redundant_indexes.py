@@ -0,0 +1,29 @@
+"""Drop indexes duplicated by unique indexes on the same leading column.
+
+Revision ID: 010_drop_redundant_indexes
+Revises: 009_patient_listing_composite_indexes
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_drop_redundant_indexes'
+down_revision = '009_patient_listing_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # uq_users_email already backs email lookups with a unique btree
+        op.drop_index('ix_users_email', 'users', postgresql_concurrently=True)
+        
+        # ix_note_versions_note_id_version leads with note_id
+        op.drop_index('ix_note_versions_note_id', 'note_versions', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_note_versions_note_id', 'note_versions', ['note_id'], postgresql_concurrently=True)
+        op.create_index('ix_users_email', 'users', ['email'], postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""Extend note listing indexes with their sort column.
+
+Revision ID: 011_note_listing_sort_indexes
+Revises: 010_drop_redundant_indexes
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_note_listing_sort_indexes'
+down_revision = '010_drop_redundant_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # list_notes with a kind filter orders by created_at DESC;
+        # get_split_notes orders a parent's splits by created_at
+        op.create_index(
+            'ix_notes_patient_kind_created', 'notes',
+            ['patient_id', 'kind', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_notes_parent_created', 'notes', ['parent_note_id', 'created_at'],
+            postgresql_concurrently=True
+        )
+        
+        # Prefixes of the indexes above
+        op.drop_index('ix_notes_patient_kind', 'notes', postgresql_concurrently=True)
+        op.drop_index('ix_notes_parent_note_id', 'notes', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_notes_parent_note_id', 'notes', ['parent_note_id'], postgresql_concurrently=True)
+        op.create_index('ix_notes_patient_kind', 'notes', ['patient_id', 'kind'], postgresql_concurrently=True)
+        op.drop_index('ix_notes_parent_created', 'notes', postgresql_concurrently=True)
+        op.drop_index('ix_notes_patient_kind_created', 'notes', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""Default timestamp columns to UTC instead of the session timezone.
+
+Revision ID: 012_utc_timestamp_defaults
+Revises: 011_note_listing_sort_indexes
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012_utc_timestamp_defaults'
+down_revision = '011_note_listing_sort_indexes'
+branch_labels = None
+depends_on = None
+
+# Naive timestamp columns the application compares against datetime.utcnow()
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('refresh_tokens', 'created_at'),
+    ('patients', 'created_at'),
+    ('patients', 'updated_at'),
+    ('patient_entities', 'created_at'),
+    ('notes', 'created_at'),
+    ('notes', 'updated_at'),
+    ('note_versions', 'created_at'),
+    ('templates', 'created_at'),
+    ('templates', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    # Changing a column default only touches the catalog, not existing rows
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('now()'))
@@ -0,0 +1,25 @@
+"""Drop the templates owner_id index duplicated by its unique constraint.
+
+Revision ID: 013_drop_templates_owner_index
+Revises: 012_utc_timestamp_defaults
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013_drop_templates_owner_index'
+down_revision = '012_utc_timestamp_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # uq_templates_owner_name (owner_id, name) leads with owner_id
+        op.drop_index('ix_templates_owner_id', 'templates', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_templates_owner_id', 'templates', ['owner_id'], postgresql_concurrently=True)
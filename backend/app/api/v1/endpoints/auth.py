@@ -5,6 +5,7 @@ Authentication endpoints for user registration, login, token refresh, and passwo
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db
+from app.core.routing import ORJSONRoute
 from app.schemas.auth import (
     LoginRequest,
     TokenResponse,
@@ -16,7 +17,7 @@ from app.schemas.user import UserCreate, UserResponse
 from app.schemas.common import MessageResponse
 from app.services.auth_service import AuthService
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -81,7 +82,8 @@ def request_password_reset(reset_data: PasswordResetRequest, db: Session = Depen
     
     - **email**: User email
     
-    Sends a password reset email (currently stubbed - logs to console).
+    Sends a password reset email (currently stubbed; the link is only logged
+    when EMAIL_STUB_LOG_RESET_LINKS is enabled).
     """
     AuthService.create_password_reset_token(db, reset_data.email)
     return MessageResponse(
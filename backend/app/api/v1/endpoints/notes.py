@@ -1,23 +1,45 @@
 """API endpoints for clinical notes management."""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status, BackgroundTasks
+import orjson
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.dependencies import get_db, get_current_user
+from app.core.routing import ORJSONRoute
+from app.core.responses import adapter_response
 from app.models.user import User
 from app.schemas.note import (
     NoteCreate,
     NoteUpdate,
     NoteResponse,
-   NoteListItem,
+    NoteListItem,
     NoteVersionResponse,
     GenerateSplitsRequest
 )
 from app.services.note_service import NoteService
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+# Built once; list endpoints serialize through these instead of response_model
+_NOTE_LIST_ADAPTER = TypeAdapter(List[NoteListItem])
+_NOTE_VERSIONS_ADAPTER = TypeAdapter(List[NoteVersionResponse])
+_NOTE_RESPONSES_ADAPTER = TypeAdapter(List[NoteResponse])
+
+# Static payload, encoded once at import time
+_DEFAULT_CATEGORIES_JSON = orjson.dumps({
+    "categories": [
+        "Background",
+        "Presenting Problem",
+        "Symptoms",
+        "Mental Status",
+        "Treatment Plan",
+        "Risk Assessment"
+    ]
+})
 
 
 @router.post("/", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
@@ -46,21 +68,8 @@ def list_notes(
     """
     notes = NoteService.get_notes_by_patient(db, patient_id, current_user.id, kind)
     
-    # Add version_count to each note
-    result = []
-    for note in notes:
-        result.append({
-            "id": note.id,
-            "title": note.title,
-            "kind": note.kind,
-            "patient_id": note.patient_id,
-            "author_id": note.author_id,
-            "created_at": note.created_at,
-            "updated_at": note.updated_at,
-            "version_count": len(note.versions)
-        })
-    
-    return result
+    # Rows already carry version_count alongside the list columns
+    return adapter_response(_NOTE_LIST_ADAPTER, notes)
 
 
 @router.get("/{note_id}", response_model=NoteResponse)
@@ -100,12 +109,25 @@ def delete_note(
 @router.get("/{note_id}/versions", response_model=List[NoteVersionResponse])
 def get_note_versions(
     note_id: UUID,
+    after_version: Optional[int] = Query(None, ge=1, description="Return versions older than this version number"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Max versions to return"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all versions for a note."""
-    versions = NoteService.get_note_versions(db, note_id, current_user.id)
-    return versions
+    """
+    Get versions for a note, newest first.
+    
+    - **after_version**: Cursor; pass the last version_number of the previous page
+    - **limit**: Page size (default: all versions, max: 200)
+    """
+    versions = NoteService.get_note_versions(
+        db,
+        note_id,
+        current_user.id,
+        after_version=after_version,
+        limit=limit
+    )
+    return adapter_response(_NOTE_VERSIONS_ADAPTER, versions)
 
 
 @router.post("/{note_id}/restore/{version_number}", response_model=NoteResponse)
@@ -128,7 +150,7 @@ def get_split_notes(
 ):
     """Get all split notes for a conceptualization note."""
     splits = NoteService.get_split_notes(db, note_id, current_user.id)
-    return splits
+    return adapter_response(_NOTE_RESPONSES_ADAPTER, splits)
 
 
 @router.post("/{note_id}/generate-splits")
@@ -146,42 +168,33 @@ async def generate_split_files(
       - If None: LLM will infer categories from content
       - If provided: Use these specific categories
     
-    Runs in background and returns immediately.
+    Runs in the background (or on the task queue worker) and returns immediately.
     """
     from app.services.tasks.factory import get_task_processor
     
     # Verify note exists and is conceptualization
-    note = NoteService.get_note_by_id(db, note_id, current_user.id)
-    
-    if note.kind != "conceptualization":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only generate splits from conceptualization notes"
-        )
+    # Sync session work goes to the threadpool so it doesn't block the event loop
+    await run_in_threadpool(
+        NoteService.get_conceptualization_note_id, db, note_id, current_user.id
+    )
     
     # Check if splits already exist
-    existing_splits = NoteService.count_split_notes(db, note_id)
-    
-    if existing_splits > 0:
+    if await run_in_threadpool(NoteService.has_split_notes, db, note_id):
+        # Only count once we know there is something to report
+        existing_splits = await run_in_threadpool(NoteService.count_split_notes, db, note_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Split files already exist for this note ({existing_splits} splits). Delete them first to regenerate."
         )
     
-    # Queue background task
+    # Hand off to the configured task processor
     processor = get_task_processor()
-    
-    async def generate_task():
-        try:
-            await processor.process_split_generation(
-                conceptualization_id=note_id,
-                categories=request.categories,
-                user_id=current_user.id
-            )
-        except Exception as e:
-            print(f"Error generating splits: {str(e)}")
-    
-    background_tasks.add_task(generate_task)
+    await processor.schedule_split_generation(
+        background_tasks,
+        conceptualization_id=note_id,
+        categories=request.categories,
+        user_id=current_user.id
+    )
     
     return {
         "message": "Split generation started",
@@ -193,13 +206,8 @@ async def generate_split_files(
 @router.get("/categories/defaults")
 def get_default_categories():
     """Get platform default split file categories."""
-    return {
-        "categories": [
-            "Background",
-            "Presenting Problem",
-            "Symptoms",
-            "Mental Status",
-            "Treatment Plan",
-            "Risk Assessment"
-        ]
-    }
+    return Response(
+        content=_DEFAULT_CATEGORIES_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
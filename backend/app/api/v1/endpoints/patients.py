@@ -1,11 +1,15 @@
 """API endpoints for patient management."""
 
+from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.dependencies import get_db, get_current_user
+from app.core.routing import ORJSONRoute
+from app.core.responses import adapter_response
 from app.models.user import User
 from app.schemas.patient import (
     PatientCreate,
@@ -17,7 +21,11 @@ from app.schemas.patient import (
 )
 from app.services.patient_service import PatientService
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+# Built once; list endpoints serialize through these instead of response_model
+_PATIENT_LIST_ADAPTER = TypeAdapter(List[PatientListItem])
+_PATIENT_ENTITIES_ADAPTER = TypeAdapter(List[PatientEntityResponse])
 
 
 @router.post("/", response_model=PatientResponse, status_code=status.HTTP_201_CREATED)
@@ -56,7 +64,8 @@ def list_patients(
         search=search,
         is_active=is_active
     )
-    return patients
+    # One date for the whole page, so every row's age is computed against it
+    return adapter_response(_PATIENT_LIST_ADAPTER, patients, context={"today": date.today()})
 
 
 @router.get("/{patient_id}", response_model=PatientResponse)
@@ -101,7 +110,7 @@ def get_patient_entities(
 ):
     """Get all entities (symptoms, medications, feelings) for a patient."""
     entities = PatientService.get_patient_entities(db, patient_id, current_user.id)
-    return entities
+    return adapter_response(_PATIENT_ENTITIES_ADAPTER, entities)
 
 
 @router.post("/{patient_id}/entities", response_model=PatientEntityResponse, status_code=status.HTTP_201_CREATED)
@@ -116,6 +125,18 @@ def add_patient_entity(
     return entity
 
 
+@router.post("/{patient_id}/entities/bulk", response_model=List[PatientEntityResponse], status_code=status.HTTP_201_CREATED)
+def add_patient_entities(
+    patient_id: UUID,
+    entities_data: List[PatientEntityCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Add several entities to a patient at once."""
+    entities = PatientService.add_patient_entities(db, patient_id, entities_data, current_user.id)
+    return adapter_response(_PATIENT_ENTITIES_ADAPTER, entities, status_code=status.HTTP_201_CREATED)
+
+
 @router.delete("/{patient_id}/entities/{entity_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_patient_entity(
     patient_id: UUID,
@@ -2,15 +2,21 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.dependencies import get_db, get_current_user
+from app.core.routing import ORJSONRoute
+from app.core.responses import adapter_response
 from app.models.user import User
 from app.schemas.template import TemplateResponse, TemplateCreate, TemplateUpdate
 from app.services.template import template_service
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+# Built once; the list endpoint serializes through this instead of response_model
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(List[TemplateResponse])
 
 
 @router.get("/", response_model=List[TemplateResponse])
@@ -28,7 +34,7 @@ def get_templates(
         owner_id=current_user.id, 
         include_defaults=include_defaults
     )
-    return templates
+    return adapter_response(_TEMPLATE_LIST_ADAPTER, templates)
 
 
 @router.get("/{id}", response_model=TemplateResponse)
@@ -38,12 +44,11 @@ def get_template(
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific template by ID."""
-    template = template_service.get_by_id(db, id)
+    # User can view their own or default templates; checked in the query
+    template = template_service.get_visible(db, id, current_user.id)
     if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-    
-    # Check permissions: User can view their own or default templates
-    if template.owner_id != current_user.id and not template.is_default:
+        if not template_service.exists(db, id):
+            raise HTTPException(status_code=404, detail="Template not found")
         raise HTTPException(status_code=403, detail="Not authorized to view this template")
         
     return template
@@ -77,14 +82,15 @@ def update_template(
     current_user: User = Depends(get_current_user)
 ):
     """Update a template."""
-    template = template_service.get_by_id(db, id)
+    template = template_service.update_for_owner(
+        db, id, owner_id=current_user.id, obj_in=template_in
+    )
     if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-        
-    if template.owner_id != current_user.id:
+        # Only the failure path pays for telling 404 from 403
+        if not template_service.exists(db, id):
+            raise HTTPException(status_code=404, detail="Template not found")
         raise HTTPException(status_code=403, detail="Not authorized to update this template")
         
-    template = template_service.update(db, db_obj=template, obj_in=template_in)
     return template
 
 
@@ -95,12 +101,11 @@ def delete_template(
     current_user: User = Depends(get_current_user)
 ):
     """Delete a template."""
-    template = template_service.get_by_id(db, id)
+    template = template_service.delete_for_owner(db, id, owner_id=current_user.id)
     if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-        
-    if template.owner_id != current_user.id:
+        # Only the failure path pays for telling 404 from 403
+        if not template_service.exists(db, id):
+            raise HTTPException(status_code=404, detail="Template not found")
         raise HTTPException(status_code=403, detail="Not authorized to delete this template")
         
-    template = template_service.delete(db, db_obj=template)
     return template
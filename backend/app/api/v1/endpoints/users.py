@@ -5,12 +5,13 @@ User management endpoints for profile and password operations.
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_user
+from app.core.routing import ORJSONRoute
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate, UserPasswordUpdate
 from app.schemas.common import MessageResponse
 from app.services.user_service import UserService
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -35,7 +36,7 @@ def update_user_profile(
     - **full_name**: Updated full name (optional)
     - **email**: Updated email (optional, must be unique)
     """
-    updated_user = UserService.update_user(db, str(current_user.id), user_data)
+    updated_user = UserService.update_user(db, current_user.id, user_data)
     return updated_user
 
 
@@ -51,5 +52,5 @@ def change_password(
     - **current_password**: User's current password
     - **new_password**: New password
     """
-    UserService.change_password(db, str(current_user.id), password_data)
+    UserService.change_password(db, current_user.id, password_data)
     return MessageResponse(message="Password successfully changed")
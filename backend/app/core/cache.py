@@ -0,0 +1,155 @@
+"""
+Redis read-through caches: the user loaded on every authenticated request,
+and generated split files.
+
+Each is disabled unless its *_CACHE_TTL_SECONDS setting is set. Redis errors
+are logged and treated as misses, so an unavailable cache only costs the
+work it was meant to save.
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+import orjson
+from app.core.config import settings
+from app.models.user import User
+
+
+logger = logging.getLogger(__name__)
+
+# Columns cached per user; password_hash is deliberately left out of Redis
+_USER_FIELDS = ("email", "full_name", "role", "is_active")
+
+_client = None
+
+
+def _get_client():
+    """Lazily create the shared Redis client (redis is installed with arq)."""
+    global _client
+    if _client is None:
+        import redis
+        
+        # Short timeouts: a slow cache must not be slower than the DB it fronts
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=0.1,
+            socket_connect_timeout=0.1
+        )
+    return _client
+
+
+def _user_key(user_id: uuid.UUID) -> str:
+    return f"user:{user_id}"
+
+
+def get_cached_user(user_id: uuid.UUID) -> Optional[User]:
+    """
+    Look up a cached user.
+    
+    Args:
+        user_id: User UUID
+    
+    Returns:
+        A detached User (no password_hash, no loaded relationships), or None
+        on a miss, when caching is disabled, or when Redis is unavailable
+    """
+    if settings.USER_CACHE_TTL_SECONDS <= 0:
+        return None
+    
+    try:
+        blob = _get_client().get(_user_key(user_id))
+    except Exception:
+        logger.warning("User cache read failed", exc_info=True)
+        return None
+    
+    if blob is None:
+        return None
+    
+    data = orjson.loads(blob)
+    return User(
+        id=user_id,
+        clinic_id=uuid.UUID(data["clinic_id"]) if data["clinic_id"] else None,
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        **{field: data[field] for field in _USER_FIELDS}
+    )
+
+
+def cache_user(user: User) -> None:
+    """
+    Store a user's profile columns with the configured TTL.
+    
+    Args:
+        user: Loaded User instance
+    """
+    if settings.USER_CACHE_TTL_SECONDS <= 0:
+        return
+    
+    blob = orjson.dumps({
+        "clinic_id": user.clinic_id,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        **{field: getattr(user, field) for field in _USER_FIELDS}
+    })
+    
+    try:
+        _get_client().set(_user_key(user.id), blob, ex=settings.USER_CACHE_TTL_SECONDS)
+    except Exception:
+        logger.warning("User cache write failed", exc_info=True)
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """
+    Drop a cached user; call after committing changes to the user row.
+    
+    Args:
+        user_id: User UUID
+    """
+    if settings.USER_CACHE_TTL_SECONDS <= 0:
+        return
+    
+    try:
+        _get_client().delete(_user_key(user_id))
+    except Exception:
+        logger.warning("User cache invalidation failed", exc_info=True)
+
+
+def get_cached_splits(key: str) -> Optional[List[Dict[str, str]]]:
+    """
+    Look up previously generated splits.
+    
+    Args:
+        key: Digest of the generation inputs
+    
+    Returns:
+        The cached splits, or None on a miss, when caching is disabled, or
+        when Redis is unavailable
+    """
+    if settings.SPLIT_CACHE_TTL_SECONDS <= 0:
+        return None
+    
+    try:
+        blob = _get_client().get(f"splits:{key}")
+    except Exception:
+        logger.warning("Split cache read failed", exc_info=True)
+        return None
+    
+    return orjson.loads(blob) if blob is not None else None
+
+
+def cache_splits(key: str, splits: List[Dict[str, str]]) -> None:
+    """
+    Store generated splits with the configured TTL.
+    
+    Args:
+        key: Digest of the generation inputs
+        splits: Dicts with 'title' and 'content' keys
+    """
+    if settings.SPLIT_CACHE_TTL_SECONDS <= 0:
+        return
+    
+    try:
+        _get_client().set(f"splits:{key}", orjson.dumps(splits), ex=settings.SPLIT_CACHE_TTL_SECONDS)
+    except Exception:
+        logger.warning("Split cache write failed", exc_info=True)
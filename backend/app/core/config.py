@@ -3,10 +3,10 @@ Application configuration and environment variables.
 Uses Pydantic Settings for type-safe configuration management.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import List, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import json
 
 
 class Settings(BaseSettings):
@@ -19,6 +19,11 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # seconds before a connection is replaced
+    DB_ECHO: bool = False  # log every statement; very slow under load
     
     # Elasticsearch
     ELASTICSEARCH_URL: str
@@ -29,19 +34,25 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    REFRESH_TOKEN_RETENTION_DAYS: int = 7  # Keep expired/revoked rows this long before purging
+    PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 30
+    
+    # Password hashing (Argon2id)
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456  # KiB
+    ARGON2_PARALLELISM: int = 1
     
     # CORS
-    BACKEND_CORS_ORIGINS: List[str] = []
+    # JSON lists are decoded by the env source itself; the str arm lets
+    # comma-separated values through to the validator instead of erroring
+    BACKEND_CORS_ORIGINS: Union[List[str], str] = []
     
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
-        """Parse CORS origins from JSON string or list."""
+        """Parse CORS origins from a comma-separated string or list."""
         if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return [origin.strip() for origin in v.split(",")]
+            return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
     
     
@@ -49,9 +60,15 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.5-flash"
     MAX_SPLIT_FILES: int = 10
+    MAX_SPLIT_SOURCE_CHARS: int = 100000  # Longer notes are rejected before calling Gemini
     
     # Task Processing
-    TASK_PROCESSOR: str = "background"  # 'background' | 'sync' | 'celery'
+    TASK_PROCESSOR: str = "background"  # 'background' | 'sync' | 'arq'
+    REDIS_URL: str = "redis://localhost:6379/0"  # Arq task queue broker
+    
+    # Caching
+    USER_CACHE_TTL_SECONDS: int = 0  # Redis cache for the per-request user lookup; 0 disables
+    SPLIT_CACHE_TTL_SECONDS: int = 0  # Redis cache for generated splits, by source content; 0 disables
     
     # Email Configuration (stubbed)
     SMTP_HOST: str = "smtp.gmail.com"
@@ -60,6 +77,7 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     EMAILS_FROM_EMAIL: str = "noreply@mindpal.com"
     EMAILS_FROM_NAME: str = "MindPal"
+    EMAIL_STUB_LOG_RESET_LINKS: bool = False  # Dev only: log working reset links while email is stubbed
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -68,5 +86,17 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Build settings once per process.
+    
+    Every module imports the settings instance below rather than
+    depending on this function, so app.dependency_overrides[get_settings]
+    has no effect.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,16 +2,44 @@
 Dependency injection for database sessions and authentication.
 """
 
+import uuid
 from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
+from app.core.cache import cache_user, get_cached_user
 from app.core.security import decode_access_token
 from app.models.user import User
 
 
-security = HTTPBearer()
+class BearerToken(HTTPBearer):
+    """
+    HTTPBearer that hands back the raw token string.
+    
+    Keeps the OpenAPI bearer scheme and HTTPBearer's 403 responses, but
+    skips building an HTTPAuthorizationCredentials model per request.
+    """
+    
+    async def __call__(self, request: Request) -> str:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        
+        if not (scheme and token):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authenticated"
+            )
+        
+        if scheme.lower() != "bearer":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid authentication credentials"
+            )
+        
+        return token
+
+
+security = BearerToken(scheme_name="HTTPBearer")  # same OpenAPI scheme name as before
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -26,15 +54,20 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+def get_current_user(
+    token: str = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Dependency that extracts and validates the current user from JWT token.
     
+    Kept sync so FastAPI runs the blocking user query in its threadpool
+    rather than on the event loop. With USER_CACHE_TTL_SECONDS set, the
+    user may come from Redis as a detached instance without password_hash;
+    services that modify the user reload it through their own session.
+    
     Args:
-        credentials: HTTP Authorization header with Bearer token
+        token: Bearer token from the Authorization header
         db: Database session
         
     Returns:
@@ -43,7 +76,6 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
     payload = decode_access_token(token)
     
     if payload is None:
@@ -61,15 +93,28 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Query user from database
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Redis first; on a miss the primary-key lookup goes through the
+    # session identity map before the DB
+    user = get_cached_user(user_uuid)
+    if user is None:
+        user = db.get(User, user_uuid)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        cache_user(user)
+    
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
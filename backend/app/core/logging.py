@@ -0,0 +1,44 @@
+"""
+Logging configuration.
+Records are handed to a queue and written by a background thread, so
+logging from async code never blocks the event loop on stream I/O.
+"""
+
+import atexit
+import logging
+import queue
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route application logs through a QueueHandler drained by a QueueListener.
+    
+    Safe to call more than once; only the first call installs handlers.
+    
+    Args:
+        level: Log level for the "app" logger
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+    
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
@@ -0,0 +1,36 @@
+"""Response helpers for serializing payloads outside FastAPI's response_model path."""
+
+from typing import Any, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    data: Any,
+    status_code: int = 200,
+    context: Optional[dict] = None
+) -> Response:
+    """
+    Validate and serialize data with a prebuilt TypeAdapter.
+
+    Returning a Response makes FastAPI skip its own response_model
+    validation and jsonable_encoder pass, so keep response_model on the
+    route for the OpenAPI schema only. The route's status_code is ignored
+    too, so pass it here.
+
+    Args:
+        adapter: Adapter built once at module load (e.g. TypeAdapter(List[Item]))
+        data: ORM objects, rows or dicts matching the adapter's type
+        status_code: HTTP status of the response
+        context: Validation context passed to the schemas' validators
+
+    Returns:
+        JSON response encoded by pydantic-core
+    """
+    validated = adapter.validate_python(data, from_attributes=True, context=context)
+    return Response(
+        content=adapter.dump_json(validated),
+        status_code=status_code,
+        media_type="application/json"
+    )
@@ -0,0 +1,32 @@
+"""Route class that decodes JSON request bodies with orjson."""
+
+from typing import Any, Callable
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose json() parses with orjson instead of stdlib json.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+    still turns malformed bodies into its usual 422 response.
+    """
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands its endpoint an ORJSONRequest."""
+    
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+        
+        return orjson_route_handler
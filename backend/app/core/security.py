@@ -3,15 +3,31 @@ Security utilities for password hashing, JWT token generation and validation.
 Uses Argon2 for password hashing and PyJWT for token management.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
+import hashlib
+import uuid
 from typing import Optional, Dict, Any
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import time
 import jwt
 from app.core.config import settings
 
 
-# Argon2 password hashing context
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Argon2id hasher (defaults follow the OWASP 19 MiB / t=2 / p=1 profile);
+# verifies any existing argon2 PHC hash, including ones made by passlib
+password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM
+)
+
+# JWT codec and signing keys, prepared once instead of per token
+_jwt = jwt.PyJWT()
+_ACCESS_KEY = settings.JWT_SECRET_KEY.encode()
+_REFRESH_KEY = settings.JWT_REFRESH_SECRET_KEY.encode()
+_ALGORITHMS = [settings.JWT_ALGORITHM]
 
 
 def hash_password(password: str) -> str:
@@ -24,7 +40,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -38,7 +54,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a hash was made with different Argon2 parameters.
+    
+    Args:
+        hashed_password: Previously hashed password
+        
+    Returns:
+        True if the hash should be replaced on next successful login
+    """
+    try:
+        return password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -52,22 +87,24 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     Returns:
         Encoded JWT token string
     """
-    to_encode = data.copy()
+    # Epoch seconds, which is what PyJWT would convert datetimes to anyway
+    now = int(time.time())
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
-    to_encode.update({
+    to_encode = {
+        **data,
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "type": "access"
-    })
+    }
     
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        _ACCESS_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
@@ -84,27 +121,48 @@ def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta
     Returns:
         Encoded JWT refresh token string
     """
-    to_encode = data.copy()
+    # Epoch seconds, which is what PyJWT would convert datetimes to anyway
+    now = int(time.time())
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     
-    to_encode.update({
+    to_encode = {
+        **data,
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
+        # Unique per token, so two logins in the same second don't collide on token_hash
+        "jti": uuid.uuid4().hex,
         "type": "refresh"
-    })
+    }
     
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt.encode(
         to_encode,
-        settings.JWT_REFRESH_SECRET_KEY,
+        _REFRESH_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
 
 
+@lru_cache(maxsize=4096)
+def _verify_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify an access token's signature, memoized per token.
+    
+    Expiry is deliberately not checked here, since a cached result would
+    outlive it; decode_access_token checks exp on every call. Invalid
+    tokens raise and are therefore never cached.
+    """
+    return _jwt.decode(
+        token,
+        _ACCESS_KEY,
+        algorithms=_ALGORITHMS,
+        options={"verify_exp": False}
+    )
+
+
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate an access token.
@@ -116,14 +174,42 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
         Decoded token payload or None if invalid
     """
     try:
-        payload = jwt.decode(
+        payload = _verify_access_token(token)
+    except jwt.PyJWTError:
+        return None
+    
+    # Verify expiry (not covered by the cached signature check)
+    exp = payload.get("exp")
+    if exp is None or exp <= time.time():
+        return None
+    
+    # Verify token type
+    if payload.get("type") != "access":
+        return None
+    
+    # Callers get their own copy, never the cached dict
+    return dict(payload)
+
+
+def decode_refresh_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode and validate a refresh token.
+    
+    Args:
+        token: JWT refresh token string to decode
+        
+    Returns:
+        Decoded token payload or None if invalid
+    """
+    try:
+        payload = _jwt.decode(
             token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+            _REFRESH_KEY,
+            algorithms=_ALGORITHMS
         )
         
         # Verify token type
-        if payload.get("type") != "access":
+        if payload.get("type") != "refresh":
             return None
             
         return payload
@@ -131,25 +217,72 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def decode_refresh_token(token: str) -> Optional[Dict[str, Any]]:
+def password_fingerprint(password_hash: str) -> str:
     """
-    Decode and validate a refresh token.
+    Short digest of a password hash, embedded in reset tokens.
+    
+    Any password change alters the hash, which invalidates every reset
+    token issued before it without storing the tokens anywhere.
     
     Args:
-        token: JWT refresh token string to decode
+        password_hash: Current stored password hash
+        
+    Returns:
+        16-character hex digest
+    """
+    return hashlib.sha256(password_hash.encode()).hexdigest()[:16]
+
+
+def create_reset_token(user_id: str, password_hash: str) -> str:
+    """
+    Create a signed, time-limited password reset token.
+    
+    Args:
+        user_id: ID of the user resetting their password
+        password_hash: User's current password hash (makes the token single-use)
+        
+    Returns:
+        Encoded JWT reset token string
+    """
+    now = int(time.time())
+    
+    to_encode = {
+        "sub": user_id,
+        "pwd": password_fingerprint(password_hash),
+        "exp": now + settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES * 60,
+        "iat": now,
+        "type": "password_reset"
+    }
+    
+    return _jwt.encode(
+        to_encode,
+        _ACCESS_KEY,
+        algorithm=settings.JWT_ALGORITHM
+    )
+
+
+def decode_reset_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode and validate a password reset token.
+    
+    Verifies signature, expiry and type only; callers must still compare
+    the "pwd" claim against the user's current password_fingerprint.
+    
+    Args:
+        token: JWT reset token string to decode
         
     Returns:
         Decoded token payload or None if invalid
     """
     try:
-        payload = jwt.decode(
+        payload = _jwt.decode(
             token,
-            settings.JWT_REFRESH_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+            _ACCESS_KEY,
+            algorithms=_ALGORITHMS
         )
         
         # Verify token type
-        if payload.get("type") != "refresh":
+        if payload.get("type") != "password_reset":
             return None
             
         return payload
@@ -157,7 +290,7 @@ def decode_refresh_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def hash_token(token: str) -> str:
+def hash_token(token: str) -> bytes:
     """
     Hash a refresh token for storage in the database.
     We store hashed versions of refresh tokens so they can be revoked.
@@ -166,7 +299,6 @@ def hash_token(token: str) -> str:
         token: Token string to hash
         
     Returns:
-        Hashed token string
+        Raw 32-byte SHA-256 digest (stored as BYTEA)
     """
-    import hashlib
-    return hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.sha256(token.encode()).digest()
@@ -0,0 +1,25 @@
+"""Helpers shared by Alembic migration scripts."""
+
+import sqlalchemy as sa
+
+
+def check_enum_exists(op, name: str) -> bool:
+    """
+    Check whether a PostgreSQL enum type already exists.
+    
+    Args:
+        op: Alembic operations proxy of the running migration
+        name: Enum type name
+        
+    Returns:
+        True if the type exists. Always False when generating offline SQL,
+        since there is no connection to inspect.
+    """
+    if op.get_context().as_sql:
+        return False
+    
+    result = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_type WHERE typname = :name"),
+        {"name": name}
+    )
+    return result.scalar() is not None
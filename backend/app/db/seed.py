@@ -5,6 +5,7 @@ Run with: python -m app.db.seed
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,68 +21,74 @@ def seed_database():
     db = SessionLocal()
     
     try:
-        # Create a test clinic
-        clinic = Clinic(
-            name="Psychology Wellness Center",
-            email="contact@psychwell.com",
-            address="123 Mental Health St, Wellness City, WC 12345"
-        )
-        db.add(clinic)
-        db.commit()
-        db.refresh(clinic)
-        print(f"✓ Created clinic: {clinic.name}")
-        
-        # Create admin user
-        admin = User(
-            email="admin@mindpal.com",
-            full_name="Admin User",
-            password_hash=hash_password("admin123"),
-            role=UserRole.ADMIN.value,  # Use .value to get the lowercase string
-            clinic_id=clinic.id
-        )
-        db.add(admin)
-        db.commit()
-        db.refresh(admin)
-        print(f"✓ Created admin user: {admin.email} (password: admin123)")
-        
-        # Set clinic contact
-        clinic.contact_id = admin.id
-        db.commit()
-        
-        # Create psychologist users
+        # Psychologist users to create alongside the admin
         psychologists = [
             {
                 "email": "dr.smith@mindpal.com",
                 "full_name": "Dr. Sarah Smith",
                 "password": "psychologist123",
-                "clinic_id": clinic.id
+                "in_clinic": True
             },
             {
                 "email": "dr.johnson@mindpal.com",
                 "full_name": "Dr. Michael Johnson",
                 "password": "psychologist123",
-                "clinic_id": clinic.id
+                "in_clinic": True
             },
             {
                 "email": "dr.williams@mindpal.com",
                 "full_name": "Dr. Emily Williams",
                 "password": "psychologist123",
-                "clinic_id": None  # Independent psychologist
+                "in_clinic": False  # Independent psychologist
             }
         ]
         
-        for psych_data in psychologists:
-            psychologist = User(
+        # Argon2 releases the GIL, so all hashes can run in parallel threads
+        passwords = ["admin123"] + [p["password"] for p in psychologists]
+        with ThreadPoolExecutor(max_workers=len(passwords)) as executor:
+            admin_hash, *psych_hashes = executor.map(hash_password, passwords)
+        
+        # Create a test clinic
+        clinic = Clinic(
+            name="Psychology Wellness Center",
+            email="contact@psychwell.com",
+            address="123 Mental Health St, Wellness City, WC 12345"
+        )
+        db.add(clinic)
+        db.flush()
+        
+        # Create admin user
+        admin = User(
+            email="admin@mindpal.com",
+            full_name="Admin User",
+            password_hash=admin_hash,
+            role=UserRole.ADMIN.value,  # Use .value to get the lowercase string
+            clinic_id=clinic.id
+        )
+        
+        users = [admin] + [
+            User(
                 email=psych_data["email"],
                 full_name=psych_data["full_name"],
-                password_hash=hash_password(psych_data["password"]),
+                password_hash=password_hash,
                 role=UserRole.PSYCHOLOGIST.value,  # Use .value to get the lowercase string
-                clinic_id=psych_data["clinic_id"]
+                clinic_id=clinic.id if psych_data["in_clinic"] else None
             )
-            db.add(psychologist)
-            db.commit()
-            db.refresh(psychologist)
-            print(f"✓ Created psychologist: {psychologist.email} (password: psychologist123)")
+            for psych_data, password_hash in zip(psychologists, psych_hashes)
+        ]
+        db.add_all(users)
+        db.flush()
+        
+        # Set clinic contact
+        clinic.contact_id = admin.id
+        
+        # Everything lands in a single transaction
+        db.commit()
+        
+        print(f"✓ Created clinic: {clinic.name}")
+        print(f"✓ Created admin user: {admin.email} (password: admin123)")
+        for psych_data in psychologists:
+            print(f"✓ Created psychologist: {psych_data['email']} (password: psychologist123)")
         
         print("\n✅ Database seeded successfully!")
         print("\nTest Accounts:")
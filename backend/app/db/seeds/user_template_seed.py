@@ -1,41 +1,37 @@
 import logging
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.models.template import Template
-from app.core.security import get_password_hash
+from app.core.security import hash_password
 
 logger = logging.getLogger(__name__)
 
 def seed_users(db: Session) -> None:
-    # 1. Ensure Dr. Smith exists
+    # 1. Ensure Dr. Smith exists (no-op if the email is already taken)
     user_email = "dr.smith@mindpal.com"
-    user = db.query(User).filter(User.email == user_email).first()
-    
-    if not user:
-        user = User(
+    user_id = db.execute(
+        insert(User).values(
             email=user_email,
-            hashed_password=get_password_hash("password"), # Default password
-            first_name="Dr.",
-            last_name="Smith",
+            password_hash=hash_password("password"), # Default password
+            full_name="Dr. Smith",
+            role=UserRole.PSYCHOLOGIST.value,
             is_active=True,
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        ).on_conflict_do_nothing(index_elements=[User.email]).returning(User.id)
+    ).scalar()
+
+    if user_id:
         logger.info(f"Created user: {user_email}")
     else:
+        user_id = db.execute(select(User.id).where(User.email == user_email)).scalar_one()
         logger.info(f"User already exists: {user_email}")
 
     # 2. Create a custom template for Dr. Smith
     template_name = "Dr. Smith's Custom Assessment"
-    template = db.query(Template).filter(
-        Template.owner_id == user.id, 
-        Template.name == template_name
-    ).first()
-
-    if not template:
-        template = Template(
+    template_id = db.execute(
+        insert(Template).values(
             name=template_name,
             content_markdown="""# Dr. Smith's Custom Assessment
 
@@ -54,10 +50,14 @@ def seed_users(db: Session) -> None:
 3. 
 """,
             is_default=False,
-            owner_id=user.id
-        )
-        db.add(template)
-        db.commit()
+            owner_id=user_id
+        ).on_conflict_do_nothing(
+            index_elements=[Template.owner_id, Template.name]
+        ).returning(Template.id)
+    ).scalar()
+    db.commit()
+
+    if template_id:
         logger.info(f"Created template: {template_name}")
     else:
         logger.info(f"Template already exists: {template_name}")
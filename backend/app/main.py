@@ -3,19 +3,25 @@ FastAPI application entry point.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.logging import setup_logging
 from app.api.v1.router import api_router
 from app.schemas.common import HealthCheckResponse
 from app import __version__
 
+setup_logging()
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=__version__,
     description="Clinical notes management system for psychologists with AI features",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes UUIDs and datetimes natively and much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -16,7 +16,7 @@ class Clinic(Base):
     """
     __tablename__ = "clinics"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=True)
     address = Column(String, nullable=True)
@@ -1,12 +1,12 @@
 """Note model for clinical notes with versioning support."""
 
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class NoteKind(str, enum.Enum):
@@ -29,21 +29,21 @@ class Note(Base):
     """
     __tablename__ = "notes"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False)
     author_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    parent_note_id = Column(UUID(as_uuid=True), ForeignKey("notes.id"), nullable=True, index=True)
+    parent_note_id = Column(UUID(as_uuid=True), ForeignKey("notes.id"), nullable=True)
     
     kind = Column(String, nullable=False, index=True)  # Uses note_kind enum at DB level
     title = Column(String, nullable=False)
     content_markdown = Column(Text, nullable=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
     patient = relationship("Patient", back_populates="notes", foreign_keys=[patient_id])
-    author = relationship("User", back_populates="notes", foreign_keys=[author_id])
+    author = relationship("User", back_populates="notes", foreign_keys=[author_id], lazy="raise")
     
     # Self-referential for split notes
     parent_note = relationship("Note", remote_side=[id], backref="split_notes", foreign_keys=[parent_note_id])
@@ -51,6 +51,14 @@ class Note(Base):
     # Versions
     versions = relationship("NoteVersion", back_populates="note", cascade="all, delete-orphan", order_by="desc(NoteVersion.version_number)")
     
+    __table_args__ = (
+        # Serve patient note listings (optionally filtered by kind, newest first)
+        Index("ix_notes_patient_kind_created", patient_id, kind, created_at.desc()),
+        Index("ix_notes_patient_created", patient_id, created_at.desc()),
+        # Serves get_split_notes (a conceptualization's splits, oldest first)
+        Index("ix_notes_parent_created", parent_note_id, created_at),
+    )
+    
     @property
     def current_version(self) -> int:
         """Get current version number (count of versions)."""
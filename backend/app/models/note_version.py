@@ -1,11 +1,11 @@
 """Note version model for tracking edit history."""
 
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class NoteVersion(Base):
@@ -17,18 +17,23 @@ class NoteVersion(Base):
     """
     __tablename__ = "note_versions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    note_id = Column(UUID(as_uuid=True), ForeignKey("notes.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    note_id = Column(UUID(as_uuid=True), ForeignKey("notes.id"), nullable=False)
     editor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     content_markdown = Column(Text, nullable=False)
     version_number = Column(Integer, nullable=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # Relationships
     note = relationship("Note", back_populates="versions")
-    editor = relationship("User", foreign_keys=[editor_id])
+    editor = relationship("User", foreign_keys=[editor_id], lazy="raise")
+    
+    __table_args__ = (
+        # One row per version; note_id leads, so it also serves per-note lookups
+        Index("ix_note_versions_note_id_version", "note_id", "version_number", unique=True),
+    )
     
     def __repr__(self):
         return f"<NoteVersion v{self.version_number} for Note {self.note_id}>"
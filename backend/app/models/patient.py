@@ -1,12 +1,12 @@
 """Patient model for storing patient information."""
 
 import uuid
-from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Date, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Date, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class Patient(Base):
@@ -17,7 +17,7 @@ class Patient(Base):
     """
     __tablename__ = "patients"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     date_of_birth = Column(Date, nullable=False)
@@ -32,40 +32,24 @@ class Patient(Base):
     tutor_relationship = Column(String, nullable=True)  # e.g., "parent", "guardian"
     
     # Soft delete flag
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     
     # Foreign key to psychologist who created this patient
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
-    creator = relationship("User", back_populates="patients", foreign_keys=[created_by])
+    creator = relationship("User", back_populates="patients", foreign_keys=[created_by], lazy="raise")
     entities = relationship("PatientEntity", back_populates="patient", cascade="all, delete-orphan")
     notes = relationship("Note", back_populates="patient", foreign_keys="Note.patient_id")
     
-    @property
-    def is_minor(self) -> bool:
-        """Calculate if patient is a minor (< 16 years old)."""
-        if not self.date_of_birth:
-            return False
-        today = date.today()
-        age = today.year - self.date_of_birth.year - (
-            (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
-        )
-        return age < 16
-    
-    @property
-    def age(self) -> int:
-        """Calculate patient's current age."""
-        if not self.date_of_birth:
-            return 0
-        today = date.today()
-        return today.year - self.date_of_birth.year - (
-            (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
-        )
+    __table_args__ = (
+        # Serves list_patients: filter by psychologist (and status), newest first
+        Index("ix_patients_creator_active_created", created_by, is_active, created_at.desc()),
+    )
     
     @property
     def full_name(self) -> str:
@@ -1,12 +1,12 @@
 """Patient entity model for symptoms, medications, and feelings."""
 
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class EntityType(str, enum.Enum):
@@ -24,18 +24,23 @@ class PatientEntity(Base):
     """
     __tablename__ = "patient_entities"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False)
     type = Column(String, nullable=False, index=True)  # Uses entity_type enum at DB level
     value = Column(Text, nullable=False)
     
     # Foreign key to user who created this entity
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # Relationships
     patient = relationship("Patient", back_populates="entities")
-    creator = relationship("User", foreign_keys=[created_by])
+    creator = relationship("User", foreign_keys=[created_by], lazy="raise")
+    
+    __table_args__ = (
+        # Serves get_patient_entities (one patient's entities, newest first)
+        Index("ix_patient_entities_patient_created", patient_id, created_at.desc()),
+    )
     
     def __repr__(self):
         return f"<PatientEntity {self.type}: {self.value[:30]}>"
@@ -1,11 +1,11 @@
 """Refresh token model for revocable JWT refresh tokens."""
 
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, DateTime, Boolean, ForeignKey, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class RefreshToken(Base):
@@ -17,10 +17,11 @@ class RefreshToken(Base):
     """
     __tablename__ = "refresh_tokens"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
-    # Hashed token value (SHA-256 hash of the actual JWT)
-    token_hash = Column(String, nullable=False, index=True, unique=True)
+    # Hashed token value (raw SHA-256 digest of the actual JWT);
+    # the unique constraint's index serves lookups
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True)
     
     # User who owns this token
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -28,10 +29,10 @@ class RefreshToken(Base):
     # Token metadata
     expires_at = Column(DateTime, nullable=False)
     is_revoked = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="refresh_tokens")
+    user = relationship("User", back_populates="refresh_tokens", lazy="raise")
     
     def __repr__(self):
         return f"<RefreshToken {self.id} (revoked={self.is_revoked})>"
@@ -1,11 +1,11 @@
 """Template model for clinical note templates."""
 
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class Template(Base):
@@ -17,17 +17,26 @@ class Template(Base):
     """
     __tablename__ = "templates"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     name = Column(String, nullable=False)
     content_markdown = Column(Text, nullable=False)
     is_default = Column(Boolean, default=False, nullable=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
-    owner = relationship("User", backref="templates", foreign_keys=[owner_id])
+    owner = relationship("User", backref="templates", foreign_keys=[owner_id], lazy="raise")
+    
+    __table_args__ = (
+        # One template name per owner; lets seeders upsert on (owner_id, name)
+        UniqueConstraint("owner_id", "name", name="uq_templates_owner_name"),
+    )
+    
+    # Fetch created_at/updated_at via RETURNING on INSERT and UPDATE, so
+    # writes don't need a refresh() SELECT afterwards
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<Template {self.name} (Default: {self.is_default})>"
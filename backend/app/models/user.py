@@ -1,12 +1,12 @@
 """User model representing psychologists and admins."""
 
 import uuid
-from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, Enum, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 from app.db.base import Base
+from app.db.functions import utcnow
 
 
 class UserRole(str, enum.Enum):
@@ -24,8 +24,8 @@ class User(Base):
     """
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    email = Column(String, unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    email = Column(String, unique=True, nullable=False)
     full_name = Column(String, nullable=False)
     password_hash = Column(String, nullable=False)
     role = Column(String, nullable=False, default="psychologist")  # Uses userrole enum type at DB level
@@ -35,8 +35,8 @@ class User(Base):
     clinic_id = Column(UUID(as_uuid=True), ForeignKey("clinics.id"), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
     clinic = relationship("Clinic", back_populates="users", foreign_keys=[clinic_id])
@@ -44,5 +44,9 @@ class User(Base):
     patients = relationship("Patient", back_populates="creator", foreign_keys="Patient.created_by")
     notes = relationship("Note", back_populates="author", foreign_keys="Note.author_id")
     
+    # Fetch created_at/updated_at via RETURNING on INSERT and UPDATE, so
+    # writes don't need a refresh() SELECT afterwards
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
@@ -1,12 +1,32 @@
 """Pydantic schemas for authentication requests and responses."""
 
-from pydantic import BaseModel, EmailStr
+import re
+from pydantic import BaseModel, EmailStr, TypeAdapter, field_validator
+
+# Cheap shape check for login; anything unusual falls back to full EmailStr rules
+_SIMPLE_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
 
 
 class LoginRequest(BaseModel):
     """Schema for login request."""
-    email: EmailStr
+    email: str
     password: str
+    
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """
+        Normalize the email the same way EmailStr does at registration.
+        
+        Plain ASCII addresses only need their domain lowercased, which skips
+        email_validator on every login; other input gets the full validation.
+        """
+        v = v.strip()
+        if v.isascii() and _SIMPLE_EMAIL_RE.match(v):
+            local, _, domain = v.rpartition('@')
+            return f"{local}@{domain.lower()}"
+        return _EMAIL_ADAPTER.validate_python(v)
 
 
 class TokenResponse(BaseModel):
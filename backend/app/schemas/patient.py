@@ -2,10 +2,46 @@
 
 from datetime import date, datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, field_validator, model_validator
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr, ValidationInfo, computed_field, field_validator, model_validator
 from uuid import UUID
 
 
+MINOR_AGE = 16
+
+
+def compute_age(date_of_birth: date, today: date) -> int:
+    """Whole years between date_of_birth and today."""
+    return today.year - date_of_birth.year - (
+        (today.month, today.day) < (date_of_birth.month, date_of_birth.day)
+    )
+
+
+class PatientAgeMixin(BaseModel):
+    """
+    Serializes age and is_minor from date_of_birth, computing the age once.
+    
+    Pass context={"today": ...} when validating many patients so the whole
+    response uses one date; otherwise date.today() is read per patient.
+    """
+    _age: int = PrivateAttr(0)
+    
+    @model_validator(mode='after')
+    def derive_age(self, info: ValidationInfo):
+        today = (info.context or {}).get("today") or date.today()
+        self._age = compute_age(self.date_of_birth, today)
+        return self
+    
+    @computed_field
+    @property
+    def age(self) -> int:
+        return self._age
+    
+    @computed_field
+    @property
+    def is_minor(self) -> bool:
+        return self._age < MINOR_AGE
+
+
 class PatientBase(BaseModel):
     """Base schema for patient data."""
     first_name: str
@@ -75,11 +111,9 @@ class PatientUpdate(BaseModel):
         return v
 
 
-class PatientResponse(PatientBase):
+class PatientResponse(PatientAgeMixin, PatientBase):
     """Schema for patient response with computed fields."""
     id: UUID
-    is_minor: bool
-    age: int
     full_name: str
     is_active: bool
     created_by: UUID
@@ -90,14 +124,13 @@ class PatientResponse(PatientBase):
         from_attributes = True
 
 
-class PatientListItem(BaseModel):
+class PatientListItem(PatientAgeMixin):
     """Simplified patient schema for list views."""
     id: UUID
     first_name: str
     last_name: str
     full_name: str
-    age: int
-    is_minor: bool
+    date_of_birth: date = Field(exclude=True)  # Only read to compute age
     email: Optional[str]
     phone: Optional[str]
     is_active: bool
@@ -3,8 +3,11 @@ Authentication service handling user registration, login, and token management.
 Business logic layer between API endpoints and database models.
 """
 
+import logging
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
+from sqlalchemy import and_, bindparam, delete, insert, or_, select, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.user import User, UserRole
@@ -14,15 +17,54 @@ from app.schemas.auth import LoginRequest
 from app.core.security import (
     hash_password,
     verify_password,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
+    create_reset_token,
+    decode_reset_token,
+    password_fingerprint,
     hash_token
 )
 from app.core.config import settings
+from app.core.cache import invalidate_user
+import hmac
 import secrets
 
 
+logger = logging.getLogger(__name__)
+
+# Verified against when the email is unknown, so those logins cost as much as real ones
+_DUMMY_PASSWORD_HASH = hash_password(secrets.token_urlsafe(16))
+
+# Hot auth statements, built once and reused through SQLAlchemy's compiled cache
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# Token state plus the claims of its owner, so a refresh is one round trip
+_REFRESH_STATE_BY_HASH = select(
+    RefreshToken.is_revoked,
+    RefreshToken.expires_at,
+    User.id,
+    User.email,
+    User.role,
+    User.is_active
+).join(User, User.id == RefreshToken.user_id).where(
+    RefreshToken.token_hash == bindparam("token_hash")
+)
+
+# Built once; column defaults (id, is_revoked, created_at) still apply
+_REFRESH_TOKEN_INSERT = insert(RefreshToken)
+
+# Revoke without loading the row first
+_REVOKE_BY_HASH = update(RefreshToken).where(
+    RefreshToken.token_hash == bindparam("b_token_hash")
+).values(is_revoked=True)
+_REVOKE_ALL_FOR_USER = update(RefreshToken).where(
+    RefreshToken.user_id == bindparam("b_user_id"),
+    RefreshToken.is_revoked.is_(False)
+).values(is_revoked=True)
+
+
 class AuthService:
     """Service class for authentication operations."""
     
@@ -42,7 +84,7 @@ class AuthService:
             HTTPException: If email already exists
         """
         # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
+        existing_user = db.execute(_USER_BY_EMAIL, {"email": user_data.email}).scalar_one_or_none()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -67,7 +109,6 @@ class AuthService:
         
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         return user
     
@@ -87,8 +128,10 @@ class AuthService:
             HTTPException: If credentials are invalid or user is inactive
         """
         # Find user
-        user = db.query(User).filter(User.email == login_data.email).first()
+        user = db.execute(_USER_BY_EMAIL, {"email": login_data.email}).scalar_one_or_none()
         if not user:
+            # Same Argon2 cost as a wrong password, so timing doesn't reveal the email
+            verify_password(login_data.password, _DUMMY_PASSWORD_HASH)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -108,6 +151,10 @@ class AuthService:
                 detail="User account is inactive"
             )
         
+        # Upgrade hashes made with older parameters (committed with the token below)
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = hash_password(login_data.password)
+        
         # Create tokens
         access_token = create_access_token(
             data={"sub": str(user.id), "email": user.email, "role": user.role}
@@ -118,12 +165,12 @@ class AuthService:
         token_hash = hash_token(refresh_token)
         expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         
-        db_refresh_token = RefreshToken(
-            token_hash=token_hash,
-            user_id=user.id,
-            expires_at=expires_at
-        )
-        db.add(db_refresh_token)
+        # Plain Core INSERT: the row is never read back, so skip the unit of work
+        db.execute(_REFRESH_TOKEN_INSERT, {
+            "token_hash": token_hash,
+            "user_id": user.id,
+            "expires_at": expires_at
+        })
         db.commit()
         
         return access_token, refresh_token
@@ -151,40 +198,40 @@ class AuthService:
                 detail="Invalid refresh token"
             )
         
-        user_id = payload.get("sub")
-        if not user_id:
+        try:
+            user_id = uuid.UUID(payload.get("sub"))
+        except (TypeError, ValueError):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid refresh token"
             )
         
-        # Check if token exists and is not revoked
+        # Check if token exists and is not revoked (owner loaded in the same query)
         token_hash = hash_token(refresh_token)
-        db_token = db.query(RefreshToken).filter(
-            RefreshToken.token_hash == token_hash
-        ).first()
+        row = db.execute(
+            _REFRESH_STATE_BY_HASH, {"token_hash": token_hash}
+        ).one_or_none()
         
-        if not db_token:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Refresh token not found"
             )
         
-        if db_token.is_revoked:
+        if row.is_revoked:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Refresh token has been revoked"
             )
         
-        if db_token.expires_at < datetime.utcnow():
+        if row.expires_at < datetime.utcnow():
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Refresh token has expired"
             )
         
-        # Get user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_active:
+        # Check user
+        if row.id != user_id or not row.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found or inactive"
@@ -192,7 +239,7 @@ class AuthService:
         
         # Create new access token
         access_token = create_access_token(
-            data={"sub": str(user.id), "email": user.email, "role": user.role}
+            data={"sub": str(row.id), "email": row.email, "role": row.role}
         )
         
         return access_token
@@ -210,19 +257,68 @@ class AuthService:
             HTTPException: If token not found
         """
         token_hash = hash_token(refresh_token)
-        db_token = db.query(RefreshToken).filter(
-            RefreshToken.token_hash == token_hash
-        ).first()
+        result = db.execute(_REVOKE_BY_HASH, {"b_token_hash": token_hash})
         
-        if not db_token:
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Refresh token not found"
             )
         
-        db_token.is_revoked = True
         db.commit()
     
+    @staticmethod
+    def revoke_all_refresh_tokens(db: Session, user_id: uuid.UUID) -> int:
+        """
+        Revoke every active refresh token of a user (logout everywhere).
+        
+        Does not commit, so callers can combine it with other changes.
+        
+        Args:
+            db: Database session
+            user_id: ID of the user whose sessions are revoked
+            
+        Returns:
+            Number of revoked tokens
+        """
+        return db.execute(_REVOKE_ALL_FOR_USER, {"b_user_id": user_id}).rowcount
+    
+    @staticmethod
+    def purge_stale_refresh_tokens(db: Session, batch_size: int = 1000) -> int:
+        """
+        Delete refresh tokens that can no longer be used.
+        
+        Rows expired or revoked more than REFRESH_TOKEN_RETENTION_DAYS ago are
+        removed in batches, each in its own short transaction, so the table
+        and its token_hash index stay proportional to live sessions.
+        
+        Args:
+            db: Database session
+            batch_size: Maximum rows deleted per transaction
+            
+        Returns:
+            Number of deleted tokens
+        """
+        cutoff = datetime.utcnow() - timedelta(days=settings.REFRESH_TOKEN_RETENTION_DAYS)
+        stale_ids = select(RefreshToken.id).where(
+            or_(
+                RefreshToken.expires_at < cutoff,
+                and_(RefreshToken.is_revoked.is_(True), RefreshToken.created_at < cutoff)
+            )
+        ).limit(batch_size)
+        
+        deleted = 0
+        while True:
+            result = db.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.id.in_(stale_ids.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+    
     @staticmethod
     def create_password_reset_token(db: Session, email: str) -> str:
         """
@@ -238,20 +334,22 @@ class AuthService:
         Raises:
             HTTPException: If user not found
         """
-        user = db.query(User).filter(User.email == email).first()
+        user = db.execute(_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
         if not user:
             # Don't reveal that user doesn't exist for security
             # But still return a token (that won't work)
             return secrets.token_urlsafe(32)
         
-        # In production, store this token with expiry in a separate table
-        # For now, we'll create a simple token
-        # TODO: Implement proper password reset token storage
-        token = secrets.token_urlsafe(32)
+        # Signed and time-limited, so confirming it needs no token table
+        token = create_reset_token(str(user.id), user.password_hash)
         
-        # Stub: Log the reset email (in production, send actual email)
-        print(f"[EMAIL STUB] Password reset token for {email}: {token}")
-        print(f"[EMAIL STUB] Reset link: http://localhost:3000/reset-password?token={token}")
+        # Stub: no email is sent yet. The token is a working credential, so it
+        # only reaches the logs when explicitly enabled for local development
+        logger.info("Password reset requested for user %s", user.id)
+        if settings.EMAIL_STUB_LOG_RESET_LINKS:
+            logger.warning(
+                "[EMAIL STUB] Reset link: http://localhost:3000/reset-password?token=%s", token
+            )
         
         return token
     
@@ -268,9 +366,33 @@ class AuthService:
         Raises:
             HTTPException: If token is invalid
         """
-        # TODO: Implement proper token validation from database
-        # For now, this is stubbed
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Password reset confirmation not implemented yet. Please use token from email stub."
+        invalid_token = HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired reset token"
         )
+        
+        payload = decode_reset_token(token)
+        if payload is None:
+            raise invalid_token
+        
+        try:
+            user_id = uuid.UUID(payload.get("sub"))
+        except (TypeError, ValueError):
+            raise invalid_token
+        
+        user = db.get(User, user_id)
+        if not user or not user.is_active:
+            raise invalid_token
+        
+        # Single use: the fingerprint no longer matches once the password changes
+        if not hmac.compare_digest(
+            str(payload.get("pwd", "")), password_fingerprint(user.password_hash)
+        ):
+            raise invalid_token
+        
+        user.password_hash = hash_password(new_password)
+        
+        # Sessions opened with the old password end with it
+        AuthService.revoke_all_refresh_tokens(db, user.id)
+        db.commit()
+        invalidate_user(user.id)
@@ -1,11 +1,104 @@
 """Gemini API client for LLM-powered features."""
 
+import hashlib
 import json
-from typing import List, Dict, Optional
+import orjson
+from collections import OrderedDict
+from typing import Any, AsyncIterator, List, Dict, Optional
+from fastapi.concurrency import run_in_threadpool
 from google import genai
+from app.core.cache import cache_splits, get_cached_splits
 from app.core.config import settings
 
 
+# Inferred categories kept per client, keyed by the content prefix actually sent
+_CATEGORY_CACHE_SIZE = 512
+
+# JSON mode request configs, built once. Gemini constrains decoding to the
+# schema, so responses are bare JSON with no fences or prose around them.
+_CATEGORY_RESPONSE_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {"type": "ARRAY", "items": {"type": "STRING"}},
+}
+_SPLIT_RESPONSE_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "title": {"type": "STRING"},
+                "content": {"type": "STRING"},
+            },
+            "required": ["title", "content"],
+            "property_ordering": ["title", "content"],
+        },
+    },
+}
+
+
+def _extract_json_array(text: str) -> str:
+    """
+    Slice the outermost JSON array out of an LLM response.
+    
+    JSON mode responses are already bare arrays; this is a cheap guard (one
+    find and one rfind) in case a response still arrives wrapped in a fence
+    or prose.
+    
+    Raises:
+        ValueError: If the text contains no array
+    """
+    start = text.find("[")
+    end = text.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("Response contains no JSON array")
+    return text[start:end + 1]
+
+
+class _JSONArrayStreamParser:
+    """
+    Pull complete items out of a JSON array that arrives in chunks.
+    
+    Anything before the opening bracket (e.g. a ```json fence) is skipped.
+    Items are decoded with json.JSONDecoder.raw_decode, which orjson has no
+    equivalent for, and only retried once a chunk could have closed an object.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self._pos = None  # Index after the last decoded item; None until '[' is seen
+        self._decoder = json.JSONDecoder()
+    
+    def feed(self, chunk: str) -> List[Any]:
+        """Add a chunk and return the items it completed."""
+        self.text += chunk
+        
+        if self._pos is None:
+            start = self.text.find("[")
+            if start == -1:
+                return []
+            self._pos = start + 1
+        elif "}" not in chunk:
+            return []
+        
+        items = []
+        while True:
+            pos = self._pos
+            while pos < len(self.text) and self.text[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(self.text) or self.text[pos] == "]":
+                break
+            
+            try:
+                item, self._pos = self._decoder.raw_decode(self.text, pos)
+            except json.JSONDecodeError:
+                # Incomplete (or invalid) item; wait for more text
+                break
+            items.append(item)
+        
+        return items
+
+
 class GeminiClient:
     """Client for interacting with Google's Gemini API."""
     
@@ -13,6 +106,7 @@ class GeminiClient:
         """Initialize the Gemini client."""
         self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
         self.model = settings.GEMINI_MODEL
+        self._category_cache: "OrderedDict[bytes, List[str]]" = OrderedDict()
     
     async def generate_split_files(
         self,
@@ -31,9 +125,46 @@ class GeminiClient:
         Returns:
             List of dicts with 'title' and 'content' keys
         """
+        return [
+            split
+            async for split in self.stream_split_files(
+                conceptualization_content, categories, max_splits
+            )
+        ]
+    
+    async def stream_split_files(
+        self,
+        conceptualization_content: str,
+        categories: Optional[List[str]] = None,
+        max_splits: int = None
+    ) -> AsyncIterator[Dict[str, str]]:
+        """
+        Generate split files, yielding each one as soon as Gemini finishes it.
+        
+        Complete results are cached by a hash of the inputs, so regenerating
+        the same note with the same categories replays them without a call.
+        
+        Args:
+            conceptualization_content: The markdown content of the conceptualization
+            categories: Optional list of category names. If None, LLM will infer.
+            max_splits: Maximum number of splits (default from settings)
+        
+        Yields:
+            Dicts with 'title' and 'content' keys, one per category
+        """
         if max_splits is None:
             max_splits = settings.MAX_SPLIT_FILES
         
+        # Identical inputs (retries, regenerations) are served from the cache
+        cache_key = hashlib.sha256(orjson.dumps(
+            [self.model, conceptualization_content, categories or [], max_splits]
+        )).hexdigest()
+        cached = await run_in_threadpool(get_cached_splits, cache_key)
+        if cached is not None:
+            for split in cached:
+                yield split
+            return
+        
         # Generate categories if not provided
         if categories is None or len(categories) == 0:
             categories = await self._infer_categories(conceptualization_content)
@@ -47,16 +178,35 @@ class GeminiClient:
             categories
         )
         
-        # Call Gemini API
-        response = self.client.models.generate_content(
+        # Call Gemini API, parsing the array as it streams in
+        parser = _JSONArrayStreamParser()
+        splits = []
+        stream = await self.client.aio.models.generate_content_stream(
             model=self.model,
-            contents=prompt
+            contents=prompt,
+            config=_SPLIT_RESPONSE_CONFIG
         )
+        async for chunk in stream:
+            for split in parser.feed(chunk.text or ""):
+                if self._is_valid_split(split):
+                    split = self._clean_split(split)
+                    splits.append(split)
+                    yield split
+        
+        if not splits:
+            # Nothing usable streamed; apply the full-response parsing and fallbacks
+            # (not cached, so a failed generation is retried next time)
+            for split in self._parse_split_response(parser.text, categories):
+                yield split
+            return
         
-        # Parse response
-        splits = self._parse_split_response(response.text, categories)
+        # Placeholders for categories the response didn't cover
+        for category in categories[len(splits):]:
+            split = self._placeholder_split(category)
+            splits.append(split)
+            yield split
         
-        return splits
+        await run_in_threadpool(cache_splits, cache_key, splits)
     
     async def _infer_categories(
         self,
@@ -65,9 +215,18 @@ class GeminiClient:
         """
         Ask LLM to suggest appropriate categories for the content.
         
+        Results are cached by a hash of the analyzed prefix, so retried or
+        repeated generations for the same note skip this round trip.
+        
         Returns:
             List of category names (4-7 items)
         """
+        cache_key = hashlib.blake2b(content[:2000].encode(), digest_size=16).digest()
+        cached = self._category_cache.get(cache_key)
+        if cached is not None:
+            self._category_cache.move_to_end(cache_key)
+            return list(cached)
+        
         prompt = f"""You are assisting a psychologist in organizing clinical notes.
 
 Analyze the following conceptualization note and suggest 4-7 appropriate categories 
@@ -77,7 +236,7 @@ for organizing this information into separate files:
 {content[:2000]}  # Limit to first 2000 chars for analysis
 ---
 
-Return ONLY a JSON array of category names, nothing else. Example:
+Return the category names, for example:
 ["Background", "Presenting Problem", "Symptoms", "Treatment Plan"]
 
 Categories should be:
@@ -87,37 +246,36 @@ Categories should be:
 - Use professional terminology
 """
         
-        response = self.client.models.generate_content(
+        # Async SDK call, so the event loop keeps serving requests meanwhile
+        response = await self.client.aio.models.generate_content(
             model=self.model,
-            contents=prompt
+            contents=prompt,
+            config=_CATEGORY_RESPONSE_CONFIG
         )
         
         try:
-            # Extract JSON from response
-            text = response.text.strip()
-            # Remove markdown code blocks if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-            
-            categories = json.loads(text)
+            categories = orjson.loads(_extract_json_array(response.text or ""))
             
             # Validate it's a list of strings
             if not isinstance(categories, list):
                 raise ValueError("Response is not a list")
             
-            categories = [str(c) for c in categories if c]
+            # The model almost always returns non-empty strings; only rebuild otherwise
+            if not all(c and isinstance(c, str) for c in categories):
+                categories = [str(c) for c in categories if c]
             
             # Ensure between 4-7 categories
-            if len(categories) < 4:
-                categories.extend(["Additional Notes"] * (4 - len(categories)))
             categories = categories[:7]
+            categories += ["Additional Notes"] * (4 - len(categories))
+            
+            # Only real LLM answers are cached; fallbacks are retried next time
+            self._category_cache[cache_key] = list(categories)
+            if len(self._category_cache) > _CATEGORY_CACHE_SIZE:
+                self._category_cache.popitem(last=False)
             
             return categories
             
-        except (json.JSONDecodeError, ValueError, IndexError) as e:
+        except (orjson.JSONDecodeError, ValueError, IndexError) as e:
             # Fallback to default categories
             return [
                 "Background",
@@ -134,7 +292,7 @@ Categories should be:
     ) -> str:
         """Build the prompt for generating split files."""
         
-        categories_list = "\n".join(f"- {cat}" for cat in categories)
+        categories_list = "\n".join([f"- {cat}" for cat in categories])
         
         prompt = f"""You are assisting a psychologist in organizing clinical notes.
 
@@ -158,16 +316,8 @@ IMPORTANT GUIDELINES:
 - Preserve any important patient quotes or observations
 - Include relevant dates, names, or specific details
 
-Return your response as a JSON array with this EXACT structure:
-[
-  {{
-    "title": "Category Name",
-    "content": "# Category Name\\n\\nMarkdown content here..."
-  }},
-  ...
-]
-
-Return ONLY the JSON array, no additional text before or after.
+Return one item per category, in the order listed, with the category name as
+"title" and the markdown note (starting with "# Category Name") as "content".
 """
         
         return prompt
@@ -188,55 +338,47 @@ Return ONLY the JSON array, no additional text before or after.
             List of dicts with title and content
         """
         try:
-            # Clean up response
-            text = response_text.strip()
-            
-            # Remove markdown code blocks if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
-            
-            # Remove any trailing markdown
-            if text.endswith("```"):
-                text = text.rsplit("```", 1)[0].strip()
-            
-            # Parse JSON
-            splits = json.loads(text)
+            splits = orjson.loads(_extract_json_array(response_text))
             
             # Validate structure
             if not isinstance(splits, list):
                 raise ValueError("Response is not a list")
             
-            validated_splits = []
-            for split in splits:
-                if isinstance(split, dict) and 'title' in split and 'content' in split:
-                    validated_splits.append({
-                        'title': str(split['title']),
-                        'content': str(split['content'])
-                    })
+            validated_splits = [
+                self._clean_split(split) for split in splits if self._is_valid_split(split)
+            ]
             
             # If we didn't get enough splits, create placeholders
             while len(validated_splits) < len(expected_categories):
                 idx = len(validated_splits)
-                category = expected_categories[idx]
-                validated_splits.append({
-                    'title': category,
-                    'content': f"# {category}\n\nNo information available for this category yet."
-                })
+                validated_splits.append(self._placeholder_split(expected_categories[idx]))
             
             return validated_splits
             
-        except (json.JSONDecodeError, ValueError, KeyError, IndexError) as e:
+        except (orjson.JSONDecodeError, ValueError, KeyError, IndexError) as e:
             # Fallback: create placeholder splits
-            return [
-                {
-                    'title': cat,
-                    'content': f"# {cat}\n\nNo information available for this category yet."
-                }
-                for cat in expected_categories
-            ]
+            return [self._placeholder_split(cat) for cat in expected_categories]
+    
+    @staticmethod
+    def _is_valid_split(split: Any) -> bool:
+        """Check an item has the title/content shape we asked for."""
+        return isinstance(split, dict) and 'title' in split and 'content' in split
+    
+    @staticmethod
+    def _clean_split(split: Dict[str, Any]) -> Dict[str, str]:
+        """Keep only title and content, as strings."""
+        return {
+            'title': str(split['title']),
+            'content': str(split['content'])
+        }
+    
+    @staticmethod
+    def _placeholder_split(category: str) -> Dict[str, str]:
+        """Split for a category the response had nothing for."""
+        return {
+            'title': category,
+            'content': f"# {category}\n\nNo information available for this category yet."
+        }
 
 
 # Global instance
@@ -4,49 +4,64 @@ Business logic layer between API endpoints and database models.
 """
 
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Row, and_, exists, func
 from fastapi import HTTPException, status
 from uuid import UUID
 from app.models.note import Note, NoteKind
 from app.models.note_version import NoteVersion
 from app.models.patient import Patient
 from app.schemas.note import NoteCreate, NoteUpdate
+from app.services.patient_service import PatientService
+from app.core.config import settings
 
 
+# NoteResponse.current_version counts versions; load just their numbers in one
+# extra IN query instead of a lazy load per note (and skip their content)
+_LOAD_VERSION_NUMBERS = selectinload(Note.versions).load_only(NoteVersion.version_number)
+
 class NoteService:
     """Service class for clinical note operations."""
     
     @staticmethod
-    def _verify_patient_ownership(db: Session, patient_id: UUID, user_id: UUID) -> Patient:
-        """Verify user owns the patient."""
-        patient = db.query(Patient).filter(
-            Patient.id == patient_id,
-            Patient.created_by == user_id
-        ).first()
+    def _assert_note_ownership(db: Session, note_id: UUID, user_id: UUID) -> None:
+        """Verify the note belongs to one of the user's patients (SELECT EXISTS)."""
+        owned = db.query(
+            exists().where(
+                Note.id == note_id,
+                Patient.id == Note.patient_id,
+                Patient.created_by == user_id
+            )
+        ).scalar()
         
-        if not patient:
+        if not owned:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Patient not found"
+                detail="Note not found"
             )
-        
-        return patient
     
     @staticmethod
-    def _create_version(db: Session, note: Note, editor_id: UUID) -> NoteVersion:
-        """Create a new version for a note."""
-        # Get current version count
-        version_count = db.query(NoteVersion).filter(
-            NoteVersion.note_id == note.id
-        ).count()
+    def _create_version(
+        db: Session,
+        note: Note,
+        editor_id: UUID,
+        version_number: Optional[int] = None
+    ) -> NoteVersion:
+        """Create a new version for a note (numbered after the latest one if not given)."""
+        if version_number is None:
+            # MAX is a single probe of the unique (note_id, version_number)
+            # index, unlike COUNT; that index also rejects concurrent duplicates
+            latest = db.query(
+                func.coalesce(func.max(NoteVersion.version_number), 0)
+            ).filter(NoteVersion.note_id == note.id).scalar()
+            version_number = latest + 1
         
         # Create new version
         version = NoteVersion(
             note_id=note.id,
             editor_id=editor_id,
             content_markdown=note.content_markdown,
-            version_number=version_count + 1
+            version_number=version_number
         )
         
         db.add(version)
@@ -63,16 +78,17 @@ class NoteService:
         - Creates initial version (v1)
         """
         # Verify patient ownership
-        NoteService._verify_patient_ownership(db, note_data.patient_id, user_id)
+        PatientService.assert_patient_ownership(db, note_data.patient_id, user_id)
         
         # If conceptualization, check for existing one
         if note_data.kind == NoteKind.CONCEPTUALIZATION.value:
-            existing = db.query(Note).filter(
-                and_(
+            # SELECT EXISTS; no note row (or its content) is loaded
+            existing = db.query(
+                exists().where(
                     Note.patient_id == note_data.patient_id,
                     Note.kind == NoteKind.CONCEPTUALIZATION.value
                 )
-            ).first()
+            ).scalar()
             
             if existing:
                 raise HTTPException(
@@ -88,7 +104,10 @@ class NoteService:
                     detail="parent_note_id is required for split notes"
                 )
             
-            parent = db.query(Note).filter(Note.id == note_data.parent_note_id).first()
+            # Only the kind is checked, so don't pull content_markdown
+            parent = db.query(Note.id, Note.kind).filter(
+                Note.id == note_data.parent_note_id
+            ).first()
             if not parent:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -101,22 +120,25 @@ class NoteService:
                     detail="Parent note must be a conceptualization note"
                 )
         
-        # Create note
+        # Create note with its initial version (v1); the unit of work inserts
+        # the note first and fills in the version's note_id, so no flush is needed
         note = Note(
             patient_id=note_data.patient_id,
             author_id=user_id,
             parent_note_id=note_data.parent_note_id,
             kind=note_data.kind,
             title=note_data.title,
-            content_markdown=note_data.content_markdown
+            content_markdown=note_data.content_markdown,
+            versions=[
+                NoteVersion(
+                    editor_id=user_id,
+                    content_markdown=note_data.content_markdown,
+                    version_number=1
+                )
+            ]
         )
         
         db.add(note)
-        db.flush()  # Get note.id
-        
-        # Create initial version
-        NoteService._create_version(db, note, user_id)
-        
         db.commit()
         db.refresh(note)
         
@@ -128,26 +150,46 @@ class NoteService:
         patient_id: UUID,
         user_id: UUID,
         kind_filter: Optional[str] = None
-    ) -> List[Note]:
+    ) -> List[Row]:
         """
         Get all notes for a patient with optional kind filter.
+        
+        Returns lightweight rows with the list-view columns plus version_count.
+        The count is aggregated in SQL, and content_markdown is never fetched.
         """
         # Verify patient ownership
-        NoteService._verify_patient_ownership(db, patient_id, user_id)
-        
-        query = db.query(Note).filter(Note.patient_id == patient_id)
+        PatientService.assert_patient_ownership(db, patient_id, user_id)
+        
+        query = db.query(
+            Note.id,
+            Note.title,
+            Note.kind,
+            Note.patient_id,
+            Note.author_id,
+            Note.created_at,
+            Note.updated_at,
+            func.count(NoteVersion.id).label("version_count")
+        ).outerjoin(
+            NoteVersion, NoteVersion.note_id == Note.id
+        ).filter(Note.patient_id == patient_id)
         
         if kind_filter:
             query = query.filter(Note.kind == kind_filter)
         
-        return query.order_by(Note.created_at.desc()).all()
+        return query.group_by(Note.id).order_by(Note.created_at.desc()).all()
     
     @staticmethod
     def get_note_by_id(db: Session, note_id: UUID, user_id: UUID) -> Note:
         """
         Get a single note by ID with ownership verification.
         """
-        note = db.query(Note).filter(Note.id == note_id).first()
+        # Ownership is part of the WHERE clause; the patient row itself isn't loaded
+        note = db.query(Note).options(_LOAD_VERSION_NUMBERS).join(
+            Patient, Patient.id == Note.patient_id
+        ).filter(
+            Note.id == note_id,
+            Patient.created_by == user_id
+        ).first()
         
         if not note:
             raise HTTPException(
@@ -155,9 +197,6 @@ class NoteService:
                 detail="Note not found"
             )
         
-        # Verify ownership through patient
-        NoteService._verify_patient_ownership(db, note.patient_id, user_id)
-        
         return note
     
     @staticmethod
@@ -212,16 +251,52 @@ class NoteService:
         db.commit()
     
     @staticmethod
-    def get_note_versions(db: Session, note_id: UUID, user_id: UUID) -> List[NoteVersion]:
+    def get_note_versions(
+        db: Session,
+        note_id: UUID,
+        user_id: UUID,
+        after_version: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[NoteVersion]:
         """
-        Get all versions for a note.
+        Get versions for a note, newest first.
+        
+        Pages by keyset on version_number (served by the unique
+        (note_id, version_number) index) rather than OFFSET.
+        
+        Args:
+            db: Database session
+            note_id: Note ID
+            user_id: Current user ID
+            after_version: Cursor; only return versions older than this number
+            limit: Max versions to return (all when omitted)
+            
+        Returns:
+            List of note versions
         """
-        # Verify ownership
-        NoteService.get_note_by_id(db, note_id, user_id)
+        # Ownership is part of the WHERE clause; the note row itself isn't loaded
+        query = db.query(NoteVersion).join(
+            Note, Note.id == NoteVersion.note_id
+        ).join(
+            Patient, Patient.id == Note.patient_id
+        ).filter(
+            NoteVersion.note_id == note_id,
+            Patient.created_by == user_id
+        )
+        
+        if after_version is not None:
+            query = query.filter(NoteVersion.version_number < after_version)
+        
+        query = query.order_by(NoteVersion.version_number.desc())
+        
+        if limit is not None:
+            query = query.limit(limit)
         
-        versions = db.query(NoteVersion).filter(
-            NoteVersion.note_id == note_id
-        ).order_by(NoteVersion.version_number.desc()).all()
+        versions = query.all()
+        
+        # Only an empty page pays for telling "no such note" apart
+        if not versions:
+            NoteService._assert_note_ownership(db, note_id, user_id)
         
         return versions
     
@@ -253,6 +328,11 @@ class NoteService:
                 detail=f"Version {version_number} not found"
             )
         
+        # Already at that content: nothing to write
+        # (str equality checks length before comparing bytes)
+        if version.content_markdown == note.content_markdown:
+            return note
+        
         # Update note content to old version
         note.content_markdown = version.content_markdown
         
@@ -269,21 +349,99 @@ class NoteService:
         """
         Get all split notes for a conceptualization.
         """
-        # Verify ownership of parent
-        parent = NoteService.get_note_by_id(db, parent_note_id, user_id)
+        # Verify ownership of parent, fetching only its kind
+        parent_kind = db.query(Note.kind).join(
+            Patient, Patient.id == Note.patient_id
+        ).filter(
+            Note.id == parent_note_id,
+            Patient.created_by == user_id
+        ).scalar()
+        
+        if parent_kind is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
         
-        if parent.kind != NoteKind.CONCEPTUALIZATION.value:
+        if parent_kind != NoteKind.CONCEPTUALIZATION.value:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Note is not a conceptualization"
             )
         
-        splits = db.query(Note).filter(
+        splits = db.query(Note).options(_LOAD_VERSION_NUMBERS).filter(
             Note.parent_note_id == parent_note_id
         ).order_by(Note.created_at.asc()).all()
         
         return splits
     
+    @staticmethod
+    def get_conceptualization_note_id(db: Session, note_id: UUID, user_id: UUID) -> UUID:
+        """
+        Check that a note is a conceptualization owned by the user and short
+        enough to split.
+        
+        Selects only id, kind and the content length, so rejecting a request
+        never pulls content_markdown.
+        
+        Args:
+            db: Database session
+            note_id: Note ID
+            user_id: Current user ID
+            
+        Returns:
+            The note ID
+            
+        Raises:
+            HTTPException: If the note is not found, not a conceptualization,
+                or longer than MAX_SPLIT_SOURCE_CHARS
+        """
+        row = db.query(
+            Note.id,
+            Note.kind,
+            func.length(Note.content_markdown).label("content_length")
+        ).join(
+            Patient, Patient.id == Note.patient_id
+        ).filter(
+            Note.id == note_id,
+            Patient.created_by == user_id
+        ).first()
+        
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
+        
+        if row.kind != NoteKind.CONCEPTUALIZATION.value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Can only generate splits from conceptualization notes"
+            )
+        
+        # Bound the prompt (and its prefill cost) before anything reaches Gemini
+        if row.content_length > settings.MAX_SPLIT_SOURCE_CHARS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Conceptualization note is too long to split ({row.content_length} "
+                    f"characters, limit {settings.MAX_SPLIT_SOURCE_CHARS})"
+                )
+            )
+        
+        return row.id
+    
+    @staticmethod
+    def has_split_notes(db: Session, parent_note_id: UUID) -> bool:
+        """
+        Check whether a conceptualization has any split notes.
+        
+        Uses EXISTS so the database stops at the first matching row.
+        """
+        return db.query(
+            db.query(Note).filter(Note.parent_note_id == parent_note_id).exists()
+        ).scalar()
+    
     @staticmethod
     def count_split_notes(db: Session, parent_note_id: UUID) -> int:
         """
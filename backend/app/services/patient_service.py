@@ -4,8 +4,8 @@ Business logic layer between API endpoints and database models.
 """
 
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import exists, insert, or_
 from fastapi import HTTPException, status
 from uuid import UUID
 from app.models.patient import Patient
@@ -16,6 +16,32 @@ from app.schemas.patient import PatientCreate, PatientUpdate, PatientEntityCreat
 class PatientService:
     """Service class for patient operations."""
     
+    @staticmethod
+    def assert_patient_ownership(db: Session, patient_id: UUID, user_id: UUID) -> None:
+        """
+        Verify user owns the patient (SELECT EXISTS, no patient row is loaded).
+        
+        Args:
+            db: Database session
+            patient_id: Patient ID
+            user_id: ID of the psychologist (for ownership check)
+            
+        Raises:
+            HTTPException: If patient not found or not owned by user
+        """
+        owned = db.query(
+            exists().where(
+                Patient.id == patient_id,
+                Patient.created_by == user_id
+            )
+        ).scalar()
+        
+        if not owned:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
+            )
+    
     @staticmethod
     def create_patient(db: Session, patient_data: PatientCreate, user_id: UUID) -> Patient:
         """
@@ -73,7 +99,19 @@ class PatientService:
         Returns:
             List of patients
         """
-        query = db.query(Patient).filter(Patient.created_by == user_id)
+        # Only load the columns the list view needs (skips the TEXT/tutor columns)
+        query = db.query(Patient).options(
+            load_only(
+                Patient.id,
+                Patient.first_name,
+                Patient.last_name,
+                Patient.date_of_birth,
+                Patient.email,
+                Patient.phone,
+                Patient.is_active,
+                Patient.created_at
+            )
+        ).filter(Patient.created_by == user_id)
         
         # Apply is_active filter if specified
         if is_active is not None:
@@ -149,10 +187,9 @@ class PatientService:
         # Get patient and verify ownership
         patient = PatientService.get_patient_by_id(db, patient_id, user_id)
         
-        # Update only provided fields
-        update_data = patient_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(patient, field, value)
+        # Update only provided fields (all scalars, so no model_dump dict is needed)
+        for field in patient_data.model_fields_set:
+            setattr(patient, field, getattr(patient_data, field))
         
         db.commit()
         db.refresh(patient)
@@ -200,7 +237,7 @@ class PatientService:
             HTTPException: If patient not found or not owned by user
         """
         # Verify patient ownership
-        PatientService.get_patient_by_id(db, patient_id, user_id)
+        PatientService.assert_patient_ownership(db, patient_id, user_id)
         
         # Get entities
         entities = db.query(PatientEntity).filter(
@@ -232,7 +269,7 @@ class PatientService:
             HTTPException: If patient not found or not owned by user
         """
         # Verify patient ownership
-        PatientService.get_patient_by_id(db, patient_id, user_id)
+        PatientService.assert_patient_ownership(db, patient_id, user_id)
         
         # Create entity
         entity = PatientEntity(
@@ -248,6 +285,52 @@ class PatientService:
         
         return entity
     
+    @staticmethod
+    def add_patient_entities(
+        db: Session,
+        patient_id: UUID,
+        entities_data: List[PatientEntityCreate],
+        user_id: UUID
+    ) -> List[PatientEntity]:
+        """
+        Add several entities to a patient in one round trip.
+        
+        Args:
+            db: Database session
+            patient_id: Patient ID
+            entities_data: Entity data (type and value) for each new entity
+            user_id: ID of the psychologist (for ownership check)
+            
+        Returns:
+            Created patient entities
+            
+        Raises:
+            HTTPException: If patient not found or not owned by user
+        """
+        # Verify patient ownership
+        PatientService.assert_patient_ownership(db, patient_id, user_id)
+        
+        if not entities_data:
+            return []
+        
+        # Single executemany INSERT ... RETURNING (batched by SQLAlchemy's
+        # insertmanyvalues) instead of one flush per db.add()
+        entities = db.scalars(
+            insert(PatientEntity).returning(PatientEntity),
+            [
+                {
+                    "patient_id": patient_id,
+                    "type": entity_data.type,
+                    "value": entity_data.value,
+                    "created_by": user_id
+                }
+                for entity_data in entities_data
+            ]
+        ).all()
+        db.commit()
+        
+        return entities
+    
     @staticmethod
     def delete_patient_entity(
         db: Session,
@@ -268,7 +351,7 @@ class PatientService:
             HTTPException: If entity not found or patient not owned by user
         """
         # Verify patient ownership
-        PatientService.get_patient_by_id(db, patient_id, user_id)
+        PatientService.assert_patient_ownership(db, patient_id, user_id)
         
         # Get and delete entity
         entity = db.query(PatientEntity).filter(
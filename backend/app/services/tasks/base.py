@@ -1,9 +1,14 @@
 """Base task processor interface using Strategy Pattern."""
 
+import logging
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Optional
 from uuid import UUID
+from fastapi import BackgroundTasks
+
+
+logger = logging.getLogger(__name__)
 
 
 class TaskStatus(str, Enum):
@@ -40,3 +45,34 @@ class TaskProcessor(ABC):
             List of created note IDs
         """
         pass
+    
+    async def schedule_split_generation(
+        self,
+        background_tasks: BackgroundTasks,
+        conceptualization_id: UUID,
+        categories: Optional[List[str]],
+        user_id: UUID
+    ) -> None:
+        """
+        Schedule split generation from an API request.
+        
+        Defaults to running after the response via FastAPI BackgroundTasks.
+        Processors that hand work to another process override this.
+        
+        Args:
+            background_tasks: BackgroundTasks of the current request
+            conceptualization_id: ID of the conceptualization note
+            categories: Optional list of category names (None = LLM infers)
+            user_id: ID of the user requesting generation
+        """
+        async def generate_task():
+            try:
+                await self.process_split_generation(
+                    conceptualization_id=conceptualization_id,
+                    categories=categories,
+                    user_id=user_id
+                )
+            except Exception:
+                logger.exception("Error generating splits for note %s", conceptualization_id)
+        
+        background_tasks.add_task(generate_task)
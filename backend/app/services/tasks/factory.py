@@ -1,15 +1,18 @@
 """Factory for creating task processors based on configuration."""
 
+from functools import lru_cache
 from app.services.tasks.base import TaskProcessor
-from app.services.tasks.processors import BackgroundTaskProcessor, SyncTaskProcessor
+from app.services.tasks.processors import BackgroundTaskProcessor, SyncTaskProcessor, ArqTaskProcessor
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
 def get_task_processor() -> TaskProcessor:
     """
     Get the configured task processor.
     
     Returns the appropriate processor based on TASK_PROCESSOR setting.
+    Built once per process, since the setting cannot change at runtime.
     """
     processor_type = settings.TASK_PROCESSOR.lower()
     
@@ -17,8 +20,8 @@ def get_task_processor() -> TaskProcessor:
         return BackgroundTaskProcessor()
     elif processor_type == "sync":
         return SyncTaskProcessor()
-    # elif processor_type == "celery":  # For future implementation
-    #     return CeleryTaskProcessor()
+    elif processor_type == "arq":
+        return ArqTaskProcessor()
     else:
         # Default to background
         return BackgroundTaskProcessor()
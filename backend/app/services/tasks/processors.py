@@ -1,7 +1,12 @@
-"""Background task processor using FastAPI BackgroundTasks."""
+"""Task processors: FastAPI BackgroundTasks, synchronous, and Arq (Redis queue)."""
 
-from typing import List, Optional
+import asyncio
+import uuid
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
+from fastapi import BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.services.tasks.base import TaskProcessor
 from app.services.llm.gemini_client import gemini_client
@@ -23,70 +28,173 @@ class BackgroundTaskProcessor(TaskProcessor):
         Generate split files from conceptualization.
         
         This runs in a background task, so errors should be handled gracefully.
+        Database work runs in the threadpool, and no connection is held
+        while waiting on Gemini.
         """
+        # 1. Fetch conceptualization note
+        content, patient_id = await run_in_threadpool(
+            self._load_conceptualization, conceptualization_id
+        )
+        
+        # 2. Stream splits from Gemini
+        splits = [
+            split async for split in gemini_client.stream_split_files(
+                conceptualization_content=content,
+                categories=categories,
+                max_splits=settings.MAX_SPLIT_FILES
+            )
+        ]
+        
+        # 3. Save them all in one transaction: a failed or interrupted stream
+        # writes nothing, so has_split_notes still allows a retry
+        return await run_in_threadpool(
+            self._save_splits, conceptualization_id, patient_id, splits, user_id
+        )
+    
+    async def process_many(
+        self,
+        conceptualization_ids: List[UUID],
+        categories: Optional[List[str]],
+        user_id: UUID,
+        max_concurrency: int = 4
+    ) -> List[Union[List[UUID], BaseException]]:
+        """
+        Generate splits for several conceptualizations, overlapping their Gemini waits.
+        
+        Each generation uses its own short-lived sessions, so they can run
+        side by side; max_concurrency bounds the parallel Gemini streams.
+        
+        Returns:
+            Per conceptualization, in order: the created note IDs, or the
+            exception that generation raised (one failure doesn't cancel the rest)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(conceptualization_id: UUID) -> List[UUID]:
+            async with semaphore:
+                return await self.process_split_generation(
+                    conceptualization_id, categories, user_id
+                )
+        
+        return await asyncio.gather(
+            *(generate(conceptualization_id) for conceptualization_id in conceptualization_ids),
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def _load_conceptualization(conceptualization_id: UUID) -> Tuple[str, UUID]:
+        """Read the conceptualization content and patient in a short-lived session."""
         from app.db.session import SessionLocal
         
         db = SessionLocal()
-        created_note_ids = []
-        
         try:
-            # 1. Fetch conceptualization note
-            conceptualization = db.query(Note).filter(
+            row = db.query(Note.content_markdown, Note.patient_id).filter(
                 Note.id == conceptualization_id
             ).first()
             
-            if not conceptualization:
+            if not row:
                 raise ValueError(f"Conceptualization note {conceptualization_id} not found")
             
-            # 2. Call Gemini to generate splits
-            splits = await gemini_client.generate_split_files(
-                conceptualization_content=conceptualization.content_markdown,
-                categories=categories,
-                max_splits=settings.MAX_SPLIT_FILES
-            )
+            return row.content_markdown, row.patient_id
+        finally:
+            db.close()
+    
+    @staticmethod
+    def _save_splits(
+        conceptualization_id: UUID,
+        patient_id: UUID,
+        splits: List[dict],
+        user_id: UUID
+    ) -> List[UUID]:
+        """Create split notes and their initial versions in one transaction."""
+        from app.db.session import SessionLocal
+        
+        if not splits:
+            # An empty executemany would run as a single all-defaults INSERT
+            return []
+        
+        # Ids are generated here so versions can reference their notes
+        # without flushing each note first
+        note_ids = [uuid.uuid4() for _ in splits]
+        
+        db = SessionLocal()
+        
+        try:
+            # One executemany INSERT per table, whatever the number of splits
+            db.execute(insert(Note), [
+                {
+                    "id": note_id,
+                    "patient_id": patient_id,
+                    "author_id": user_id,
+                    "parent_note_id": conceptualization_id,
+                    "kind": "split",
+                    "title": split['title'],
+                    "content_markdown": split['content']
+                }
+                for note_id, split in zip(note_ids, splits)
+            ])
             
-            # 3. Create Note records for each split
-            for split in splits:
-                # Create split note
-                split_note = Note(
-                    patient_id=conceptualization.patient_id,
-                    author_id=user_id,
-                    parent_note_id=conceptualization_id,
-                    kind="split",
-                    title=split['title'],
-                    content_markdown=split['content']
-                )
-                
-                db.add(split_note)
-                db.flush()  # Get ID
-                
-                # Create initial version
-                version = NoteVersion(
-                    note_id=split_note.id,
-                    editor_id=user_id,
-                    content_markdown=split['content'],
-                    version_number=1
-                )
-                
-                db.add(version)
-                created_note_ids.append(split_note.id)
+            # Initial versions
+            db.execute(insert(NoteVersion), [
+                {
+                    "note_id": note_id,
+                    "editor_id": user_id,
+                    "content_markdown": split['content'],
+                    "version_number": 1
+                }
+                for note_id, split in zip(note_ids, splits)
+            ])
             
             db.commit()
             
-            return created_note_ids
+            return note_ids
             
-        except Exception as e:
+        except Exception:
             db.rollback()
-            # Log error (in production, use proper logging)
-            print(f"Error in split generation: {str(e)}")
+            # Logged by the caller that scheduled the task
             raise
             
         finally:
             db.close()
 
 
-class SyncTaskProcessor(TaskProcessor):
-    """Synchronous task processor (for testing or simple deployments)."""
+class SyncTaskProcessor(BackgroundTaskProcessor):
+    """
+    Synchronous task processor (for testing or simple deployments).
+    
+    Inherits the background processor's generation directly instead of
+    wrapping a second instance; only scheduling differs.
+    """
+    
+    async def schedule_split_generation(
+        self,
+        background_tasks: BackgroundTasks,
+        conceptualization_id: UUID,
+        categories: Optional[List[str]],
+        user_id: UUID
+    ) -> None:
+        """Run inline so the request returns once splits are created."""
+        await self.process_split_generation(conceptualization_id, categories, user_id)
+
+
+class ArqTaskProcessor(TaskProcessor):
+    """
+    Enqueue tasks on Redis for the Arq worker (app.services.tasks.worker).
+    
+    Keeps the slow LLM call and its DB writes out of the API process.
+    """
+    
+    _pool = None
+    
+    @classmethod
+    async def _get_pool(cls):
+        """Lazily create the shared Redis pool used for enqueueing."""
+        if cls._pool is None:
+            from arq import create_pool
+            from arq.connections import RedisSettings
+            
+            cls._pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+        return cls._pool
     
     async def process_split_generation(
         self,
@@ -94,11 +202,26 @@ class SyncTaskProcessor(TaskProcessor):
         categories: Optional[List[str]],
         user_id: UUID
     ) -> List[UUID]:
-        """Process synchronously (blocks until complete)."""
-        # For now, just use the same logic as background
-        processor = BackgroundTaskProcessor()
-        return await processor.process_split_generation(
-            conceptualization_id,
+        """
+        Enqueue split generation.
+        
+        Returns an empty list: notes are created later by the worker.
+        """
+        pool = await self._get_pool()
+        await pool.enqueue_job(
+            "process_split_generation",
+            str(conceptualization_id),
             categories,
-            user_id
+            str(user_id)
         )
+        return []
+    
+    async def schedule_split_generation(
+        self,
+        background_tasks: BackgroundTasks,
+        conceptualization_id: UUID,
+        categories: Optional[List[str]],
+        user_id: UUID
+    ) -> None:
+        """Enqueue directly; nothing is left running in the API process."""
+        await self.process_split_generation(conceptualization_id, categories, user_id)
@@ -0,0 +1,57 @@
+"""
+Arq worker consuming tasks enqueued by ArqTaskProcessor.
+Run with: arq app.services.tasks.worker.WorkerSettings
+"""
+
+from typing import List, Optional
+from uuid import UUID
+from arq import cron
+from arq.connections import RedisSettings
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.services.auth_service import AuthService
+from app.services.tasks.processors import BackgroundTaskProcessor
+
+
+async def process_split_generation(
+    ctx: dict,
+    conceptualization_id: str,
+    categories: Optional[List[str]],
+    user_id: str
+) -> List[str]:
+    """Generate split files for a conceptualization note."""
+    note_ids = await BackgroundTaskProcessor().process_split_generation(
+        conceptualization_id=UUID(conceptualization_id),
+        categories=categories,
+        user_id=UUID(user_id)
+    )
+    return [str(note_id) for note_id in note_ids]
+
+
+def _purge_refresh_tokens() -> int:
+    """Run the purge on its own session (called in a worker thread)."""
+    from app.db.session import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        return AuthService.purge_stale_refresh_tokens(db)
+    finally:
+        db.close()
+
+
+async def purge_refresh_tokens(ctx: dict) -> int:
+    """Delete expired and revoked refresh tokens past their retention."""
+    return await run_in_threadpool(_purge_refresh_tokens)
+
+
+async def startup(ctx: dict) -> None:
+    setup_logging()
+
+
+class WorkerSettings:
+    """Arq worker configuration."""
+    functions = [process_split_generation]
+    cron_jobs = [cron(purge_refresh_tokens, hour={3}, minute={0})]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
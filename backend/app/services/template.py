@@ -1,19 +1,63 @@
 """Service for managing templates."""
 
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 from uuid import UUID
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import Row, delete, or_, update
+from sqlalchemy.exc import IntegrityError
 
 from app.models.template import Template
 from app.schemas.template import TemplateCreate, TemplateUpdate
 
 
+# Columns served by TemplateResponse
+_RESPONSE_COLUMNS = (
+    Template.id,
+    Template.owner_id,
+    Template.name,
+    Template.content_markdown,
+    Template.is_default,
+    Template.created_at,
+    Template.updated_at
+)
+
+# System defaults are shared reference data; each process keeps the rows this
+# long. Local writes invalidate immediately, other workers catch up on expiry.
+_DEFAULTS_TTL_SECONDS = 300
+
+
 class TemplateService:
     """Service for template CRUD operations."""
 
-    def get_by_id(self, db: Session, id: UUID) -> Optional[Template]:
-        return db.query(Template).filter(Template.id == id).first()
+    def __init__(self):
+        self._defaults: Optional[Tuple[float, List[Row]]] = None  # (expires_at, rows)
+
+    def get_defaults(self, db: Session) -> List[Row]:
+        """Get the system default templates, served from the in-process cache."""
+        cached = self._defaults
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        # Rows are plain tuples, not session-bound, so they can be shared
+        rows = db.query(*_RESPONSE_COLUMNS).filter(Template.is_default == True).all()
+        self._defaults = (time.monotonic() + _DEFAULTS_TTL_SECONDS, rows)
+        return rows
+
+    def invalidate_defaults(self) -> None:
+        """Drop the cached defaults after a write that may have changed them."""
+        self._defaults = None
+
+    def get_visible(self, db: Session, id: UUID, user_id: UUID) -> Optional[Template]:
+        """Get a template the user owns or that is a system default."""
+        return db.query(Template).filter(
+            Template.id == id,
+            or_(Template.owner_id == user_id, Template.is_default == True)
+        ).first()
+
+    def exists(self, db: Session, id: UUID) -> bool:
+        return db.query(db.query(Template).filter(Template.id == id).exists()).scalar()
 
     def get_multi(
         self, 
@@ -22,28 +66,28 @@ class TemplateService:
         include_defaults: bool = True,
         skip: int = 0, 
         limit: int = 100
-    ) -> List[Template]:
+    ) -> List[Row]:
         """
-        Get templates.
+        Get templates as plain rows of the TemplateResponse columns.
         If owner_id is provided, returns user's templates AND default templates (if include_defaults=True).
         If owner_id is None, returns only default templates (if include_defaults=True).
+        Defaults are listed first and come from the in-process cache.
         """
-        filters = []
+        if not owner_id:
+            # Only system defaults (nothing if those weren't requested either)
+            return self.get_defaults(db)[skip:skip + limit] if include_defaults else []
+        
+        # Column rows skip ORM instance construction and can never lazy-load
+        query = db.query(*_RESPONSE_COLUMNS).filter(Template.owner_id == owner_id)
         
-        if owner_id and include_defaults:
-            # User's templates OR system defaults
-            filters.append(or_(Template.owner_id == owner_id, Template.is_default == True))
-        elif owner_id:
+        if not include_defaults:
             # Only user's templates
-            filters.append(Template.owner_id == owner_id)
-        elif include_defaults:
-            # Only system defaults
-            filters.append(Template.is_default == True)
-        else:
-            # Returns nothing if no owner and no defaults requested (edge case)
-            return []
-            
-        return db.query(Template).filter(and_(*filters)).offset(skip).limit(limit).all()
+            return query.offset(skip).limit(limit).all()
+        
+        # User's templates AND system defaults: defaults come from the cache,
+        # so only the user's non-default templates are queried
+        owned = query.filter(Template.is_default == False).limit(skip + limit).all()
+        return (self.get_defaults(db) + owned)[skip:skip + limit]
 
     def create(self, db: Session, obj_in: TemplateCreate, owner_id: Optional[UUID] = None) -> Template:
         db_obj = Template(
@@ -53,24 +97,83 @@ class TemplateService:
             owner_id=owner_id
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        try:
+            db.commit()
+        except IntegrityError:
+            # uq_templates_owner_name: one template name per owner
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Template name already exists"
+            )
+        if db_obj.is_default:
+            self.invalidate_defaults()
         return db_obj
 
     def update(self, db: Session, db_obj: Template, obj_in: TemplateUpdate) -> Template:
+        was_default = db_obj.is_default
         update_data = obj_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_obj, field, value)
         
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
+        if was_default or db_obj.is_default:
+            self.invalidate_defaults()
         return db_obj
 
     def delete(self, db: Session, db_obj: Template) -> Template:
         db.delete(db_obj)
         db.commit()
+        if db_obj.is_default:
+            self.invalidate_defaults()
         return db_obj
 
+    def update_for_owner(
+        self, db: Session, id: UUID, owner_id: UUID, obj_in: TemplateUpdate
+    ) -> Optional[Row]:
+        """
+        Update an owned template in a single UPDATE ... RETURNING.
+        Returns None if no template with this ID belongs to owner_id.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        where = (Template.id == id, Template.owner_id == owner_id)
+        
+        if not update_data:
+            return db.query(*_RESPONSE_COLUMNS).filter(*where).first()
+        
+        # updated_at is filled in by the column's onupdate
+        try:
+            row = db.execute(
+                update(Template).where(*where).values(**update_data).returning(*_RESPONSE_COLUMNS)
+            ).first()
+            db.commit()
+        except IntegrityError:
+            # Renamed onto another of the owner's templates
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Template name already exists"
+            )
+        # A default may have been edited, demoted (is_default False) or promoted
+        if row and (row.is_default or "is_default" in update_data):
+            self.invalidate_defaults()
+        return row
+
+    def delete_for_owner(self, db: Session, id: UUID, owner_id: UUID) -> Optional[Row]:
+        """
+        Delete an owned template in a single DELETE ... RETURNING.
+        Returns None if no template with this ID belongs to owner_id.
+        """
+        row = db.execute(
+            delete(Template).where(
+                Template.id == id, Template.owner_id == owner_id
+            ).returning(*_RESPONSE_COLUMNS)
+        ).first()
+        db.commit()
+        if row and row.is_default:
+            self.invalidate_defaults()
+        return row
+
 
 template_service = TemplateService()
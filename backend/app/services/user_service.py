@@ -2,10 +2,13 @@
 User service for profile management operations.
 """
 
+from uuid import UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserUpdate, UserPasswordUpdate
+from app.core.cache import invalidate_user
 from app.core.security import hash_password, verify_password
 
 
@@ -13,7 +16,7 @@ class UserService:
     """Service class for user management operations."""
     
     @staticmethod
-    def get_user_by_id(db: Session, user_id: str) -> User:
+    def get_user_by_id(db: Session, user_id: UUID) -> User:
         """
         Get user by ID.
         
@@ -27,7 +30,8 @@ class UserService:
         Raises:
             HTTPException: If user not found
         """
-        user = db.query(User).filter(User.id == user_id).first()
+        # Identity-map hit when the request already loaded the current user
+        user = db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -36,7 +40,7 @@ class UserService:
         return user
     
     @staticmethod
-    def update_user(db: Session, user_id: str, user_data: UserUpdate) -> User:
+    def update_user(db: Session, user_id: UUID, user_data: UserUpdate) -> User:
         """
         Update user profile.
         
@@ -53,29 +57,31 @@ class UserService:
         """
         user = UserService.get_user_by_id(db, user_id)
         
-        # Check if email is being changed and if it's already in use
+        # Update email if it's being changed; uniqueness is left to the
+        # users.email constraint, which also closes the check-then-write race
         if user_data.email and user_data.email != user.email:
-            existing_user = db.query(User).filter(User.email == user_data.email).first()
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already in use"
-                )
             user.email = user_data.email
         
         # Update full name if provided
         if user_data.full_name:
             user.full_name = user_data.full_name
         
-        db.commit()
-        db.refresh(user)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already in use"
+            )
+        invalidate_user(user_id)
         
         return user
     
     @staticmethod
     def change_password(
         db: Session,
-        user_id: str,
+        user_id: UUID,
         password_data: UserPasswordUpdate
     ) -> None:
         """
@@ -101,3 +107,4 @@ class UserService:
         # Update password
         user.password_hash = hash_password(password_data.new_password)
         db.commit()
+        invalidate_user(user_id)
@@ -1,40 +1,99 @@
 """Pytest configuration and fixtures for backend tests."""
 
 import pytest
+from argon2 import PasswordHasher
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.db.base import Base
 from app.core.dependencies import get_db
 from app.models.user import User, UserRole
+from app.core import security
 from app.core.security import hash_password
 
 # Use an in-memory SQLite database for tests
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+SQLALCHEMY_DATABASE_URL = "sqlite://"
 
+# StaticPool hands every checkout the same connection, so the TestClient's
+# threads all see the one in-memory database
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db():
-    """Create a fresh database for each test."""
+# The models use postgresql.UUID; SQLite has no such type, so store the hex
+# string UUID already binds to on non-native dialects
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+# pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+# emit BEGIN itself so the per-test rollback below covers everything
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(monkeypatch):
+    """Hash with Argon2's minimum work factor; tests don't need production cost."""
+    monkeypatch.setattr(
+        security,
+        "password_hasher",
+        PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+    )
+
+
+@pytest.fixture(scope="session")
+def schema():
+    """Create the tables once for the whole test run."""
     Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db(schema):
+    """
+    Give each test a session inside a transaction that is rolled back after it.
+    
+    Service commits only release a SAVEPOINT, so nothing a test writes
+    outlives it and the schema never has to be rebuilt.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Start the app once; tests share this TestClient."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db):
-    """Get TestClient with database dependency override."""
+def client(app_client, db):
+    """Get the shared TestClient with its database dependency pointed at this test's session."""
     def override_get_db():
         try:
             yield db
@@ -42,8 +101,8 @@ def client(db):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    app_client.cookies.clear()
+    yield app_client
     app.dependency_overrides.clear()
 
 
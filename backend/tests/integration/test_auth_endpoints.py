@@ -2,6 +2,7 @@
 
 import pytest
 from fastapi import status
+from app.core.security import create_reset_token
 
 
 def test_register_user(client):
@@ -166,3 +167,39 @@ def test_protected_endpoint_without_token(client):
     """Test that protected endpoints require authentication."""
     response = client.get("/api/v1/users/me")
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_password_reset(client, test_user):
+    """Test password reset with a signed reset token."""
+    old_tokens = client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "testpassword123"}
+    ).json()
+    token = create_reset_token(str(test_user.id), test_user.password_hash)
+    
+    reset_response = client.post(
+        "/api/v1/auth/password-reset-confirm",
+        json={"token": token, "new_password": "newpassword456"}
+    )
+    assert reset_response.status_code == status.HTTP_200_OK
+    
+    # New password works
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "newpassword456"}
+    )
+    assert login_response.status_code == status.HTTP_200_OK
+    
+    # Sessions from before the reset are revoked
+    refresh_response = client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": old_tokens["refresh_token"]}
+    )
+    assert refresh_response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    # Token is single-use
+    reuse_response = client.post(
+        "/api/v1/auth/password-reset-confirm",
+        json={"token": token, "new_password": "anotherpassword789"}
+    )
+    assert reuse_response.status_code == status.HTTP_400_BAD_REQUEST
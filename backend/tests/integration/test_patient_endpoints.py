@@ -0,0 +1,124 @@
+"""Integration tests for patient entity endpoints."""
+
+import pytest
+from datetime import date
+from fastapi import status
+from app.core.security import create_access_token, hash_password
+from app.models.patient import Patient
+from app.schemas.patient import compute_age
+from app.models.user import User, UserRole
+
+
+def _create_user(db, email):
+    """Insert a psychologist directly through the test's session."""
+    user = User(
+        email=email,
+        full_name="Test User",
+        password_hash=hash_password("password123"),
+        role=UserRole.PSYCHOLOGIST
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _create_patient(db, owner, date_of_birth=date(1990, 1, 1)):
+    """Insert a patient (an adult by default) owned by the given user."""
+    patient = Patient(
+        first_name="Jane",
+        last_name="Doe",
+        date_of_birth=date_of_birth,
+        created_by=owner.id
+    )
+    db.add(patient)
+    db.commit()
+    return patient
+
+
+@pytest.fixture
+def owner(db):
+    """Psychologist who owns the test patient."""
+    return _create_user(db, "owner@example.com")
+
+
+@pytest.fixture
+def auth_headers(owner):
+    """Access token for the owner."""
+    access_token = create_access_token(
+        data={"sub": str(owner.id), "email": owner.email, "role": owner.role}
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+def test_add_patient_entities_bulk(client, db, owner, auth_headers):
+    """Test creating several entities in one request."""
+    patient = _create_patient(db, owner)
+    
+    response = client.post(
+        f"/api/v1/patients/{patient.id}/entities/bulk",
+        headers=auth_headers,
+        json=[
+            {"type": "symptom", "value": "Insomnia"},
+            {"type": "medication", "value": "Sertraline"}
+        ]
+    )
+    
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert [(e["type"], e["value"]) for e in data] == [
+        ("symptom", "Insomnia"),
+        ("medication", "Sertraline")
+    ]
+    assert all(e["patient_id"] == str(patient.id) for e in data)
+    assert all(e["created_by"] == str(owner.id) for e in data)
+    
+    # The entities are persisted, not just echoed back
+    response = client.get(f"/api/v1/patients/{patient.id}/entities", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert {e["id"] for e in response.json()} == {e["id"] for e in data}
+
+
+def test_add_patient_entities_bulk_empty(client, db, owner, auth_headers):
+    """Test an empty list creates nothing."""
+    patient = _create_patient(db, owner)
+    
+    response = client.post(
+        f"/api/v1/patients/{patient.id}/entities/bulk",
+        headers=auth_headers,
+        json=[]
+    )
+    
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == []
+
+
+def test_add_patient_entities_bulk_foreign_patient(client, db, auth_headers):
+    """Test entities can't be added to another psychologist's patient."""
+    other = _create_user(db, "other@example.com")
+    patient = _create_patient(db, other)
+    
+    response = client.post(
+        f"/api/v1/patients/{patient.id}/entities/bulk",
+        headers=auth_headers,
+        json=[{"type": "feeling", "value": "Anxious"}]
+    )
+    
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Patient not found"
+
+
+def test_list_patients_age(client, db, owner, auth_headers):
+    """Test list items carry each patient's age and minor status."""
+    today = date.today()
+    adult = _create_patient(db, owner)
+    minor = _create_patient(db, owner, date_of_birth=date(today.year - 10, 1, 1))
+    
+    response = client.get("/api/v1/patients/", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    patients = {p["id"]: p for p in response.json()}
+    assert patients[str(adult.id)]["age"] == compute_age(adult.date_of_birth, today)
+    assert patients[str(adult.id)]["is_minor"] is False
+    assert patients[str(minor.id)]["age"] == 10
+    assert patients[str(minor.id)]["is_minor"] is True
+    assert "date_of_birth" not in patients[str(minor.id)]
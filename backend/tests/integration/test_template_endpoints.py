@@ -0,0 +1,51 @@
+"""Integration tests for template endpoints."""
+
+import pytest
+from fastapi import status
+from app.core.security import create_access_token
+
+
+@pytest.fixture
+def auth_headers(test_user):
+    """Access token for the test user."""
+    access_token = create_access_token(
+        data={"sub": str(test_user.id), "email": test_user.email, "role": test_user.role}
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+def _create_template(client, headers, name):
+    return client.post(
+        "/api/v1/templates/",
+        headers=headers,
+        json={"name": name, "content_markdown": f"# {name}"}
+    )
+
+
+def test_create_template_duplicate_name(client, auth_headers):
+    """Test a second template with the same name is rejected, not a 500."""
+    response = _create_template(client, auth_headers, "Intake")
+    assert response.status_code == status.HTTP_200_OK
+    
+    response = _create_template(client, auth_headers, "Intake")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Template name already exists"
+
+
+def test_update_template_duplicate_name(client, auth_headers):
+    """Test renaming a template onto another of the user's templates."""
+    _create_template(client, auth_headers, "Intake")
+    template_id = _create_template(client, auth_headers, "Follow-up").json()["id"]
+    
+    response = client.put(
+        f"/api/v1/templates/{template_id}",
+        headers=auth_headers,
+        json={"name": "Intake"}
+    )
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Template name already exists"
+    
+    # The rejected rename left the template as it was
+    response = client.get(f"/api/v1/templates/{template_id}", headers=auth_headers)
+    assert response.json()["name"] == "Follow-up"
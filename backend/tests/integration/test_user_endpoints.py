@@ -2,39 +2,38 @@
 
 import pytest
 from fastapi import status
+from app.core.security import create_access_token, hash_password
+from app.models.user import User, UserRole
 
 
-def get_auth_headers(client):
-    """Helper to get authentication headers."""
-    # Register and login
-    client.post(
-        "/api/v1/auth/register",
-        json={
-            "email": "testuser@example.com",
-            "full_name": "Test User",
-            "password": "password123",
-            "role": "psychologist"
-        }
+@pytest.fixture
+def auth_headers(db):
+    """
+    Insert the test user and sign an access token for it directly.
+    
+    Skips the register and login round trips; those are covered by the
+    auth endpoint tests. The user is rolled back with the test's session.
+    """
+    user = User(
+        email="testuser@example.com",
+        full_name="Test User",
+        password_hash=hash_password("password123"),
+        role=UserRole.PSYCHOLOGIST
     )
+    db.add(user)
+    db.commit()
     
-    response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "password123"
-        }
+    access_token = create_access_token(
+        data={"sub": str(user.id), "email": user.email, "role": user.role}
     )
-    tokens = response.json()
-    return {"Authorization": f"Bearer {tokens['access_token']}"}
+    return {"Authorization": f"Bearer {access_token}"}
 
 
-def test_update_user_profile(client):
+def test_update_user_profile(client, auth_headers):
     """Test updating user profile."""
-    headers = get_auth_headers(client)
-    
     response = client.patch(
         "/api/v1/users/me",
-        headers=headers,
+        headers=auth_headers,
         json={
             "full_name": "Updated Name"
         }
@@ -45,13 +44,39 @@ def test_update_user_profile(client):
     assert data["full_name"] == "Updated Name"
 
 
-def test_change_password(client):
-    """Test password change."""
-    headers = get_auth_headers(client)
+def test_update_user_email_already_in_use(client, auth_headers):
+    """Test changing email to one that belongs to another user."""
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "other@example.com",
+            "full_name": "Other User",
+            "password": "password123",
+            "role": "psychologist"
+        }
+    )
+    
+    response = client.patch(
+        "/api/v1/users/me",
+        headers=auth_headers,
+        json={
+            "email": "other@example.com"
+        }
+    )
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Email already in use"
     
+    # The failed update left the profile untouched
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.json()["email"] == "testuser@example.com"
+
+
+def test_change_password(client, auth_headers):
+    """Test password change."""
     response = client.patch(
         "/api/v1/users/me/password",
-        headers=headers,
+        headers=auth_headers,
         json={
             "current_password": "password123",
             "new_password": "newpassword456"
@@ -71,13 +96,11 @@ def test_change_password(client):
     assert login_response.status_code == status.HTTP_200_OK
 
 
-def test_change_password_wrong_current(client):
+def test_change_password_wrong_current(client, auth_headers):
     """Test password change with wrong current password."""
-    headers = get_auth_headers(client)
-    
     response = client.patch(
         "/api/v1/users/me/password",
-        headers=headers,
+        headers=auth_headers,
         json={
             "current_password": "wrongpassword",
             "new_password": "newpassword456"
@@ -8,6 +8,9 @@ from app.core.security import (
     create_refresh_token,
     decode_access_token,
     decode_refresh_token,
+    create_reset_token,
+    decode_reset_token,
+    password_fingerprint,
     hash_token
 )
 
@@ -94,3 +97,21 @@ def test_token_hashing():
     
     # Different tokens should produce different hashes
     assert hash_token("different-token") != hashed
+
+
+def test_reset_token_creation_and_validation():
+    """Test creating and validating password reset tokens."""
+    token = create_reset_token("user-789", "stored-hash")
+    
+    decoded = decode_reset_token(token)
+    assert decoded is not None
+    assert decoded["sub"] == "user-789"
+    assert decoded["type"] == "password_reset"
+    assert decoded["pwd"] == password_fingerprint("stored-hash")
+    
+    # Changing the password invalidates the fingerprint
+    assert decoded["pwd"] != password_fingerprint("new-stored-hash")
+    
+    # Reset tokens are not access tokens and vice versa
+    assert decode_access_token(token) is None
+    assert decode_reset_token(create_access_token({"sub": "user-789"})) is None
@@ -0,0 +1,143 @@
+"""Unit tests for the split generation task processor."""
+
+import uuid
+import pytest
+from datetime import date
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.note import Note
+from app.models.note_version import NoteVersion
+from app.models.patient import Patient
+from app.services.llm.gemini_client import gemini_client
+from app.services.tasks.processors import BackgroundTaskProcessor
+
+
+CONCEPTUALIZATION_ID = uuid.uuid4()
+PATIENT_ID = uuid.uuid4()
+USER_ID = uuid.uuid4()
+
+SPLITS = [
+    {"title": "Symptoms", "content": "# Symptoms"},
+    {"title": "History", "content": "# History"}
+]
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Skip the DB: load a fixed conceptualization and record every save."""
+    calls = []
+    
+    def load_conceptualization(conceptualization_id):
+        return f"content of {conceptualization_id}", PATIENT_ID
+    
+    def save_splits(conceptualization_id, patient_id, splits, user_id):
+        calls.append((conceptualization_id, splits))
+        return [uuid.uuid4() for _ in splits]
+    
+    monkeypatch.setattr(BackgroundTaskProcessor, "_load_conceptualization", staticmethod(load_conceptualization))
+    monkeypatch.setattr(BackgroundTaskProcessor, "_save_splits", staticmethod(save_splits))
+    return calls
+
+
+def mock_stream(monkeypatch, splits, error=None):
+    """Make Gemini stream the given splits, then optionally fail."""
+    async def stream_split_files(conceptualization_content, categories=None, max_splits=None):
+        for split in splits:
+            yield split
+        if error is not None:
+            raise error
+    
+    monkeypatch.setattr(gemini_client, "stream_split_files", stream_split_files)
+
+
+@pytest.mark.asyncio
+async def test_split_generation_saves_once(monkeypatch, saved):
+    """Test every streamed split is written by a single save."""
+    mock_stream(monkeypatch, SPLITS)
+    
+    note_ids = await BackgroundTaskProcessor().process_split_generation(CONCEPTUALIZATION_ID, None, USER_ID)
+    
+    assert saved == [(CONCEPTUALIZATION_ID, SPLITS)]
+    assert len(note_ids) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_saves_nothing(monkeypatch, saved):
+    """Test a stream that fails midway leaves no partial splits behind."""
+    mock_stream(monkeypatch, SPLITS[:1], error=RuntimeError("Gemini unavailable"))
+    
+    with pytest.raises(RuntimeError):
+        await BackgroundTaskProcessor().process_split_generation(CONCEPTUALIZATION_ID, None, USER_ID)
+    
+    assert saved == []
+
+
+def test_save_splits_batches_inserts(db, monkeypatch, test_user):
+    """Test all splits are written with one INSERT per table."""
+    patient = Patient(first_name="Jane", last_name="Doe", date_of_birth=date(1990, 1, 1), created_by=test_user.id)
+    db.add(patient)
+    db.flush()
+    conceptualization = Note(
+        patient_id=patient.id,
+        author_id=test_user.id,
+        kind="conceptualization",
+        title="Conceptualization",
+        content_markdown="# Conceptualization"
+    )
+    db.add(conceptualization)
+    db.commit()
+    
+    # _save_splits opens its own session; join the test's transaction instead
+    connection = db.get_bind()
+    monkeypatch.setattr(
+        "app.db.session.SessionLocal",
+        lambda: Session(bind=connection, join_transaction_mode="create_savepoint")
+    )
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        note_ids = BackgroundTaskProcessor._save_splits(conceptualization.id, patient.id, SPLITS * 3, test_user.id)
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+    
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 2
+    assert len(note_ids) == 6
+    
+    splits = db.query(Note).filter(Note.parent_note_id == conceptualization.id).all()
+    assert {note.id for note in splits} == set(note_ids)
+    assert db.query(NoteVersion).filter(NoteVersion.note_id.in_(note_ids)).count() == 6
+
+
+def test_save_splits_empty(monkeypatch):
+    """Test an empty list writes nothing and opens no session."""
+    monkeypatch.setattr("app.db.session.SessionLocal", None)
+    
+    assert BackgroundTaskProcessor._save_splits(CONCEPTUALIZATION_ID, PATIENT_ID, [], USER_ID) == []
+
+
+@pytest.mark.asyncio
+async def test_process_many_isolates_failures(monkeypatch, saved):
+    """Test batch results keep their order and one failure doesn't stop the rest."""
+    ids = [uuid.uuid4() for _ in range(3)]
+    failing = f"content of {ids[1]}"
+    
+    async def stream_split_files(conceptualization_content, categories=None, max_splits=None):
+        if conceptualization_content == failing:
+            raise RuntimeError("Gemini unavailable")
+        yield {"title": conceptualization_content, "content": conceptualization_content}
+    
+    monkeypatch.setattr(gemini_client, "stream_split_files", stream_split_files)
+    
+    results = await BackgroundTaskProcessor().process_many(ids, None, USER_ID, max_concurrency=2)
+    
+    assert len(results) == 3
+    assert isinstance(results[1], RuntimeError)
+    assert len(results[0]) == 1 and len(results[2]) == 1
+    # Only the successful conceptualizations were saved
+    assert sorted(call[0] for call in saved) == sorted([ids[0], ids[2]])
+    assert all(splits[0]["title"] == f"content of {cid}" for cid, splits in saved)